@@ -7,6 +7,7 @@ import sys
 from typing import Any
 
 from poe_sidekick.core.engine import Engine, WindowError
+from poe_sidekick.services._win32_input import enable_dpi_awareness
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -43,6 +44,8 @@ async def handle_shutdown(engine: Engine, sig: int) -> None:
 
 async def main() -> None:
     """Start the POE Sidekick application."""
+    # Window rects, captures and input all have to agree on physical pixels
+    enable_dpi_awareness()
     engine = Engine()
     main_task = None
 
@@ -0,0 +1,121 @@
+"""Win32 window event hook used to wake up window detection.
+
+SetWinEventHook delivers out-of-context events through the message queue of
+the installing thread, so the hook lives on a dedicated thread running a
+message loop and forwards events to asyncio thread-safely.
+"""
+
+import asyncio
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_SHOW = 0x8002
+
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+WM_QUIT = 0x0012
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+user32.SetWinEventHook.argtypes = (
+    wintypes.DWORD,
+    wintypes.DWORD,
+    wintypes.HMODULE,
+    WINEVENTPROC,
+    wintypes.DWORD,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+user32.UnhookWinEvent.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+user32.GetMessageW.restype = wintypes.BOOL
+user32.PostThreadMessageW.argtypes = (wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+user32.PostThreadMessageW.restype = wintypes.BOOL
+
+# Top-level window changes that can make the game window detectable
+_EVENTS = (EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_SHOW)
+
+
+class WindowEventHook:
+    """Set an asyncio.Event whenever a top-level window is shown or focused.
+
+    Args:
+        event: Event to set, owned by the running event loop
+    """
+
+    def __init__(self, event: asyncio.Event) -> None:
+        self._event = event
+        self._loop = asyncio.get_running_loop()
+        # Keep a reference to the callback, ctypes does not
+        self._proc = WINEVENTPROC(self._on_event)
+        self._thread: threading.Thread | None = None
+        self._thread_id = 0
+        self._ready = threading.Event()
+        self._installed = False
+
+    def start(self) -> bool:
+        """Install the hook on a background thread.
+
+        Returns:
+            bool: True if the hook was installed, False if window events are unavailable
+        """
+        self._thread = threading.Thread(target=self._run, name="window_events", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self._installed
+
+    def stop(self) -> None:
+        """Remove the hook and stop the background thread."""
+        if self._thread is None:
+            return
+        user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Install the hooks and pump messages until WM_QUIT."""
+        self._thread_id = kernel32.GetCurrentThreadId()
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        hooks = [user32.SetWinEventHook(event, event, None, self._proc, 0, 0, flags) for event in _EVENTS]
+        self._installed = all(hooks)
+        if not self._installed:
+            logging.debug(f"Failed to install window event hook: {ctypes.get_last_error()}")
+        self._ready.set()
+
+        try:
+            msg = wintypes.MSG()
+            while self._installed and user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+
+    def _on_event(
+        self, _hook: int, _event: int, hwnd: int, id_object: int, id_child: int, _thread: int, _time: int
+    ) -> None:
+        # Only the window itself is interesting, not its child objects
+        if hwnd and id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+            self._loop.call_soon_threadsafe(self._event.set)
@@ -0,0 +1,119 @@
+"""High resolution waitable timer used to pace the capture loop.
+
+asyncio.sleep on Windows is bound to the system timer quantum (~15.6 ms),
+which is too coarse for frame pacing. A waitable timer created with
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION wakes up with sub-millisecond
+precision without raising the system wide timer resolution.
+"""
+
+import asyncio
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+INFINITE = 0xFFFFFFFF
+
+kernel32.CreateWaitableTimerExW.argtypes = (wintypes.LPVOID, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD)
+kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+kernel32.CreateEventW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR)
+kernel32.CreateEventW.restype = wintypes.HANDLE
+kernel32.SetEvent.argtypes = (wintypes.HANDLE,)
+kernel32.SetEvent.restype = wintypes.BOOL
+kernel32.SetWaitableTimer.argtypes = (
+    wintypes.HANDLE,
+    ctypes.POINTER(wintypes.LARGE_INTEGER),
+    wintypes.LONG,
+    wintypes.LPVOID,
+    wintypes.LPVOID,
+    wintypes.BOOL,
+)
+kernel32.SetWaitableTimer.restype = wintypes.BOOL
+kernel32.WaitForMultipleObjects.argtypes = (
+    wintypes.DWORD,
+    ctypes.POINTER(wintypes.HANDLE),
+    wintypes.BOOL,
+    wintypes.DWORD,
+)
+kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+kernel32.CloseHandle.restype = wintypes.BOOL
+
+
+class HighResTimer:
+    """Sleep for short delays using a high resolution waitable timer.
+
+    Falls back to asyncio.sleep when the timer is unavailable (Windows
+    versions before 10 1803).
+    """
+
+    def __init__(self) -> None:
+        timer = kernel32.CreateWaitableTimerExW(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS)
+        # Manual reset event signaled by close() to wake up a pending wait
+        cancel = kernel32.CreateEventW(None, True, False, None) if timer else None
+        if not timer or not cancel:
+            logging.debug(f"High resolution timer unavailable: {ctypes.get_last_error()}")
+            if timer:
+                kernel32.CloseHandle(timer)
+            timer = cancel = None
+        self._handles = (wintypes.HANDLE * 2)(timer, cancel) if timer else None
+        # Guards the handles, never held while waiting
+        self._lock = threading.Lock()
+        self._waiting = False
+        self._closed = False
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait for the given delay without blocking the event loop.
+
+        Args:
+            seconds: Delay in seconds
+        """
+        if self._handles is None or self._closed:
+            await asyncio.sleep(seconds)
+            return
+        await asyncio.to_thread(self._wait, seconds)
+
+    def close(self) -> None:
+        """Wake up a pending sleep and release the timer.
+
+        Does not block, the handles are released by the pending sleep if there is one.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._handles is None:
+                return
+            kernel32.SetEvent(self._handles[1])
+            if not self._waiting:
+                self._release()
+
+    def _wait(self, seconds: float) -> None:
+        """Block the calling thread until the delay has elapsed or the timer is closed."""
+        # Negative due times are relative, in 100 ns units
+        due_time = wintypes.LARGE_INTEGER(-max(int(seconds * 10_000_000), 1))
+        with self._lock:
+            if self._closed or self._handles is None:
+                return
+            if not kernel32.SetWaitableTimer(self._handles[0], ctypes.byref(due_time), 0, None, None, False):
+                raise ctypes.WinError(ctypes.get_last_error())
+            self._waiting = True
+        try:
+            kernel32.WaitForMultipleObjects(2, self._handles, False, INFINITE)
+        finally:
+            with self._lock:
+                self._waiting = False
+                if self._closed:
+                    self._release()
+
+    def _release(self) -> None:
+        """Close both handles, called with the lock held."""
+        if self._handles is None:
+            return
+        for handle in self._handles:
+            kernel32.CloseHandle(handle)
+        self._handles = None
@@ -6,9 +6,12 @@ including window management, screenshot stream, modules, and workflows.
 
 import argparse
 import asyncio
+import contextlib
 import logging
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING, Any, NoReturn, Protocol, TypedDict, cast
 
+from poe_sidekick.core._win32_events import WindowEventHook
 from poe_sidekick.core.stream import ScreenshotStream
 from poe_sidekick.core.window import GameWindow
 from poe_sidekick.plugins.loot_manager.module import LootModule
@@ -20,6 +23,9 @@ from poe_sidekick.services.vision import VisionService
 if TYPE_CHECKING:
     from poe_sidekick.workflows.loot import LootWorkflow
 
+# First retry delay of window detection, doubled per attempt up to window.detection_interval
+MIN_DETECTION_INTERVAL = 0.02
+
 
 class Module(Protocol):
     """Protocol defining required module interface."""
@@ -154,9 +160,11 @@ class Engine:
         self._config = ConfigService()
         self._window = GameWindow()
         self._screenshot_stream: ScreenshotStream | None = None
+        self._vision_service: VisionService | None = None
         self._modules: dict[str, Module] = {}
         self._running: bool = False
         self._shutdown_requested: bool = False
+        self._window_found = asyncio.Event()
         self._logger = logging.getLogger(__name__)
         self._workflow: Any | None = None  # Type will be refined when workflow system is typed
         self._frame_tasks: list[asyncio.Task[None]] = []
@@ -205,6 +213,10 @@ class Engine:
         self._shutdown_requested = True
         self._running = False
 
+        # Let a running workflow return from execute()
+        if self._workflow is not None:
+            self._workflow.stop()
+
         # Cancel any pending frame tasks
         for task in self._frame_tasks:
             if not task.done():
@@ -234,6 +246,7 @@ class Engine:
                 raise_stream_initialization_error()
 
             vision_service = VisionService(self._screenshot_stream)
+            self._vision_service = vision_service
             template_service = TemplateService(self._config)
             item_service = ItemService(self._config)  # Initialize ItemService
 
@@ -244,6 +257,8 @@ class Engine:
                     min_delay_seconds=input_config.get("min_delay_seconds", 0.1),
                     cursor_speed=input_config.get("cursor_speed", 1.0),
                     key_press_duration=input_config.get("key_press_duration", 0.1),
+                    failsafe_enabled=input_config.get("failsafe_enabled", True),
+                    failsafe_points=[tuple(point) for point in input_config.get("failsafe_points", [(0, 0)])],
                 )
             )
 
@@ -288,19 +303,25 @@ class Engine:
 
             # Clean up workflow if running
             if self._workflow is not None:
-                cleanup_tasks.append(asyncio.create_task(self._workflow.deactivate_modules()))
+                cleanup_tasks.append(
+                    asyncio.create_task(self._safe_cleanup("workflow", self._workflow.deactivate_modules()))
+                )
 
             # Clean up modules
-            for module in self._modules.values():
-                cleanup_tasks.append(asyncio.create_task(module.cleanup()))
+            for name, module in self._modules.items():
+                cleanup_tasks.append(asyncio.create_task(self._safe_cleanup(name, module.cleanup())))
 
             # Clean up screenshot stream
             if self._screenshot_stream is not None:
-                cleanup_tasks.append(asyncio.create_task(self._screenshot_stream.stop()))
+                cleanup_tasks.append(asyncio.create_task(self._safe_cleanup("stream", self._screenshot_stream.stop())))
+
+            # Release the vision service's OCR engine and thread pool
+            if self._vision_service is not None:
+                cleanup_tasks.append(asyncio.create_task(self._safe_cleanup("vision", self._vision_service.cleanup())))
 
-            # Wait for all cleanup tasks with timeout
+            # Wait for all cleanup tasks with timeout, a failing component does not affect the others
             if cleanup_tasks:  # Only wait if there are tasks
-                await asyncio.wait_for(asyncio.gather(*cleanup_tasks), timeout=timeout)
+                await asyncio.wait_for(asyncio.gather(*cleanup_tasks, return_exceptions=True), timeout=timeout)
 
         except TimeoutError:
             self._logger.warning(f"Component cleanup timed out after {timeout} seconds")
@@ -309,6 +330,19 @@ class Engine:
         finally:
             self._modules.clear()
             self._screenshot_stream = None
+            self._vision_service = None
+
+    async def _safe_cleanup(self, name: str, cleanup: Awaitable[None]) -> None:
+        """Await a component cleanup, logging instead of raising errors.
+
+        Args:
+            name: Component name used in log messages
+            cleanup: Cleanup awaitable of the component
+        """
+        try:
+            await cleanup
+        except Exception:
+            self._logger.exception(f"Error cleaning up {name}")
 
     @property
     def is_running(self) -> bool:
@@ -322,37 +356,71 @@ class Engine:
     async def _detect_window(self) -> None:
         """Attempt to detect the game window with retries.
 
+        Detection runs as a background task that sets the window found event,
+        this only waits for it to finish or for the detection timeout.
+
         Raises:
             WindowError: If shutdown is requested before finding the window or if detection fails.
         """
-        window_title = self._config.get_value("core", "window.title")
-        executable = self._config.get_value("core", "window.executable")
-        interval = self._config.get_value("core", "window.detection_interval", 1.0)
-        timeout = self._config.get_value("core", "window.detection_timeout", 30.0)
-        attempts = int(timeout / interval)
-
+        # Read the window settings once, the detection loop only gets plain values
+        window_config = self._config.get_value("core", "window", {})
+        window_title = window_config.get("title")
+        executable = window_config.get("executable")
+        max_interval = window_config.get("detection_interval", 1.0)
+        timeout = window_config.get("detection_timeout", 30.0)
+
+        self._window_found.clear()
+        detector = asyncio.create_task(self._detect_loop(window_title, max_interval))
         try:
-            for _ in range(attempts):
-                if self._shutdown_requested:
-                    break
+            # Unlike wait_for, wait leaves the task running on timeout so it can be cleaned up below
+            await asyncio.wait({detector}, timeout=timeout)
+        except asyncio.CancelledError:
+            self._logger.info("Window detection cancelled due to shutdown request")
+            self._shutdown_requested = True
+            raise
+        finally:
+            detector.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await detector
+
+        if not self._window_found.is_set() and not self._shutdown_requested:
+            raise WindowError(window_title, executable)
+
+    async def _detect_loop(self, window_title: str, max_interval: float) -> None:
+        """Poll for the game window until it is found or shutdown is requested.
+
+        Retries start quickly and back off exponentially up to the configured
+        detection interval, so a window that appears shortly after startup is
+        found without waiting a full interval. While waiting, a window event
+        hook wakes detection as soon as any window is shown or focused.
 
+        Args:
+            window_title: Title of the game window, used in log messages
+            max_interval: Longest delay between two detection attempts
+        """
+        interval = min(MIN_DETECTION_INTERVAL, max_interval)
+        window_event = asyncio.Event()
+        hook = WindowEventHook(window_event)
+        if not hook.start():
+            self._logger.debug("Window events unavailable, polling for the game window")
+
+        try:
+            while not self._shutdown_requested:
+                window_event.clear()
                 try:
                     if self._window.find_window():
                         self._logger.info(f"Found {window_title} window")
+                        self._window_found.set()
                         return
                 except Exception as e:
                     self._logger.debug(f"Error during window detection: {e}")
 
                 self._logger.debug(f"Waiting for {window_title} window...")
-                await asyncio.sleep(interval)
-
-            if not self._shutdown_requested:
-                raise WindowError(window_title, executable)
-
-        except asyncio.CancelledError:
-            self._logger.info("Window detection cancelled due to shutdown request")
-            self._shutdown_requested = True
-            raise
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(window_event.wait(), interval)
+                interval = min(interval * 2, max_interval)
+        finally:
+            hook.stop()
 
     @property
     def window(self) -> GameWindow:
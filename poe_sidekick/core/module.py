@@ -12,7 +12,7 @@ from rx.core.observable.observable import Observable
 from rx.subject.subject import Subject
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModuleConfig:
     """Configuration for a module instance.
 
@@ -118,7 +118,9 @@ class BaseModule(ABC):
             return
 
         try:
-            self._frame_subject.on_next(frame)
+            # Nothing subscribes to most modules, skip the subject's locking and dispatch then
+            if self._frame_subject.observers:
+                self._frame_subject.on_next(frame)
             await self._process_frame(frame)
         except Exception:
             self.logger.exception(f"Error processing frame in module {self.name}")
@@ -4,9 +4,12 @@ import asyncio
 import logging
 import time
 from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
+import cv2
+
 # dxcam has no type stubs, but we need it for screen capture
 import dxcam
 import numpy as np
@@ -15,6 +18,7 @@ from numpy.typing import NDArray
 from rx.core.observable.observable import Observable
 from rx.subject.subject import Subject
 
+from poe_sidekick.core._win32_timer import HighResTimer
 from poe_sidekick.core.types import DXCamera, StreamConfig, StreamMetrics
 from poe_sidekick.services.config import ConfigService
 
@@ -28,6 +32,66 @@ class ScreenshotStreamConfigError(ValueError):
         super().__init__(message)
 
 
+@dataclass
+class FrameBundle:
+    """Shared representations of the current frame.
+
+    Buffers are allocated once for the capture resolution and rewritten in
+    place on every frame, so consumers can reuse them without converting
+    the frame themselves.
+
+    Args:
+        bgr: The captured frame
+        gray: Grayscale version of the frame
+        integral: Integral image of the grayscale frame
+        integral_sq: Squared integral image of the grayscale frame
+        pyr_gray: Grayscale Gaussian pyramid, level 0 is the full resolution frame
+    """
+
+    bgr: NDArray[np.uint8]
+    gray: NDArray[np.uint8]
+    integral: NDArray[np.int32]
+    integral_sq: NDArray[np.float64]
+    pyr_gray: list[NDArray[np.uint8]]
+
+    @classmethod
+    def allocate(cls, frame: NDArray[np.uint8], levels: int = 3) -> "FrameBundle":
+        """Allocate buffers sized for the given frame.
+
+        Args:
+            frame: Captured BGR frame whose shape determines the buffer sizes
+            levels: Number of pyramid levels, including full resolution
+
+        Returns:
+            FrameBundle with uninitialized buffers, call update() to fill them
+        """
+        height, width = frame.shape[:2]
+        gray = np.empty((height, width), dtype=np.uint8)
+        pyr_gray = [gray]
+        for _ in range(levels - 1):
+            pyr_gray.append(np.empty(((pyr_gray[-1].shape[0] + 1) // 2, (pyr_gray[-1].shape[1] + 1) // 2), np.uint8))
+
+        return cls(
+            bgr=frame,
+            gray=gray,
+            integral=np.empty((height + 1, width + 1), dtype=np.int32),
+            integral_sq=np.empty((height + 1, width + 1), dtype=np.float64),
+            pyr_gray=pyr_gray,
+        )
+
+    def update(self, frame: NDArray[np.uint8]) -> None:
+        """Recompute all representations for a new frame in place.
+
+        Args:
+            frame: Newly captured BGR frame with the allocated shape
+        """
+        self.bgr = frame
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self.gray)
+        cv2.integral2(self.gray, sum=self.integral, sqsum=self.integral_sq, sdepth=cv2.CV_32S, sqdepth=cv2.CV_64F)
+        for src, dst in zip(self.pyr_gray, self.pyr_gray[1:], strict=False):
+            cv2.pyrDown(src, dst=dst, dstsize=(dst.shape[1], dst.shape[0]))
+
+
 class ScreenshotStream:
     """Provides a stream of screenshots for game state analysis."""
 
@@ -42,6 +106,8 @@ class ScreenshotStream:
         self._subject = Subject()  # Type inference through usage
         self._running = False
         self._capture_task: asyncio.Task[None] | None = None
+        self._bundle: FrameBundle | None = None
+        self._timer: HighResTimer | None = None
 
         # Load config
         self._load_config()
@@ -103,8 +169,6 @@ class ScreenshotStream:
         if self._frame_count % self._debug_interval == 0:
             logging.debug(f"Attempting to save debug frame {self._frame_count}")
             try:
-                import cv2
-
                 if frame.size == 0:
                     logging.error("Frame is empty, skipping save")
                     return
@@ -120,6 +184,7 @@ class ScreenshotStream:
     def _process_frame(self, frame: NDArray[np.uint8], frame_start: float) -> None:
         """Process captured frame and update metrics."""
         self._update_memory_metrics()
+        self._update_bundle(frame)
 
         # Process and emit frame
         self._subject.on_next(frame)
@@ -133,6 +198,12 @@ class ScreenshotStream:
         self._frame_count += 1
         self._save_debug_frame(frame)
 
+    def _update_bundle(self, frame: NDArray[np.uint8]) -> None:
+        """Refresh the shared frame bundle, allocating it on first use or resize."""
+        if self._bundle is None or self._bundle.bgr.shape != frame.shape:
+            self._bundle = FrameBundle.allocate(frame)
+        self._bundle.update(frame)
+
     async def _capture_loop(self) -> None:
         """Continuous capture loop with performance monitoring."""
         while self._running:
@@ -149,7 +220,15 @@ class ScreenshotStream:
                     self._metrics["dropped_frames"] += 1
 
             self._last_frame_time = frame_start
-            await asyncio.sleep(self._frame_delay)
+            await self._wait_next_frame(frame_start)
+
+    async def _wait_next_frame(self, frame_start: float) -> None:
+        """Sleep until the next frame is due, yielding at least once."""
+        delay = self._frame_delay - (time.perf_counter() - frame_start)
+        if delay <= 0 or self._timer is None:
+            await asyncio.sleep(max(delay, 0))
+            return
+        await self._timer.sleep(delay)
 
     async def start(self, region: tuple[int, int, int, int] | None = None) -> None:
         """Start capturing and streaming screenshots.
@@ -166,6 +245,7 @@ class ScreenshotStream:
             camera.region = region
 
         self._camera = camera
+        self._timer = HighResTimer()
         self._running = True
         self._capture_task = asyncio.create_task(self._capture_loop())
 
@@ -181,6 +261,9 @@ class ScreenshotStream:
                     await self._capture_task
             if self._camera:
                 self._camera = None
+            if self._timer:
+                self._timer.close()
+                self._timer = None
             self._subject.on_completed()
 
             # Log final metrics
@@ -202,6 +285,11 @@ class ScreenshotStream:
         """Access the RxPY observable for subscribing to screenshots."""
         return cast(Observable, self._subject)
 
+    @property
+    def current_bundle(self) -> FrameBundle | None:
+        """Access shared representations of the most recent frame."""
+        return self._bundle
+
     @property
     def metrics(self) -> StreamMetrics:
         """Access current performance metrics."""
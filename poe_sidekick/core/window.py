@@ -4,25 +4,38 @@ This module provides functionality to detect and track the Path of Exile 2 game
 """
 
 import logging
-import os
 
-import win32api
+import psutil
 import win32con
 import win32gui
-import win32process
 
 from poe_sidekick.services.config import ConfigService
 
+# Show command restoring a minimized window, resolved once at import
+_SW_RESTORE = win32con.SW_RESTORE
+
+
+class _WindowFoundError(Exception):
+    """Raised from a window enumeration callback to stop at the matching window."""
+
+    def __init__(self, hwnd: int) -> None:
+        super().__init__(hwnd)
+        self.hwnd = hwnd
+
 
 class GameWindow:
     """Class for detecting and tracking the Path of Exile 2 game window."""
 
+    __slots__ = ("_config", "_exe_name", "_game_processes", "_hwnd", "_title")
+
     def __init__(self) -> None:
         """Initialize the GameWindow instance."""
         self._hwnd: int | None = None
         self._config = ConfigService()
         self._title: str | None = None
         self._exe_name: str | None = None
+        # Game processes found by the last scan, reused while they keep running
+        self._game_processes: list[psutil.Process] = []
 
     async def initialize(self) -> None:
         """Initialize window properties from config.
@@ -33,42 +46,67 @@ class GameWindow:
         self._title = self._config.get_value("core", "window.title")
         self._exe_name = self._config.get_value("core", "window.executable")
 
-    def _is_game_process(self, hwnd: int) -> bool:
-        """Check if the window belongs to the Path of Exile 2 process.
+    def _find_game_processes(self) -> list[psutil.Process]:
+        """Get the running processes started from the game executable.
+
+        Processes found by a previous call are reused while they are still
+        running, so the process list is only scanned until the game starts.
+
+        Returns:
+            list[psutil.Process]: Processes whose executable name matches the configured one.
+        """
+        processes = [process for process in self._game_processes if process.is_running()]
+        if not processes:
+            processes = [process for process in psutil.process_iter(["name"]) if process.info["name"] == self._exe_name]
+        self._game_processes = processes
+        return processes
+
+    def _find_process_window(self, process: psutil.Process, window_title: str) -> int | None:
+        """Find the visible game window among the windows owned by a process.
 
         Args:
-            hwnd: Window handle to check.
+            process: Process to enumerate windows for.
+            window_title: Title of the game window.
 
         Returns:
-            bool: True if the window belongs to the game process, False otherwise.
+            int | None: Handle of the window with the configured title, None if not found.
         """
+
+        def enum_windows_callback(hwnd: int, _extra: None) -> bool:
+            # Cheapest checks first, the length is never below the actual title length
+            if not win32gui.IsWindowVisible(hwnd) or win32gui.GetWindowTextLength(hwnd) < len(window_title):
+                return True
+            title = win32gui.GetWindowText(hwnd)
+            logging.debug(f"Checking window: '{title}' against '{window_title}'")
+            if title == window_title:
+                # Raising out of the callback stops the enumeration
+                raise _WindowFoundError(hwnd)
+            return True
+
         try:
-            # Get the process ID for the window
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-
-            # Get a handle to the process
-            process_handle = win32api.OpenProcess(
-                win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ, False, pid
-            )
-
-            if process_handle:
-                # Get the process executable path
-                exe_path = str(win32process.GetModuleFileNameEx(process_handle, 0))
-                win32api.CloseHandle(process_handle)
-
-                # Check if the executable name matches
-                basename = os.path.basename(exe_path)
-                logging.debug(f"Comparing executable names: {basename} == {self._exe_name}")
-                return basename == self._exe_name
-
-        except (win32gui.error, win32process.error, win32api.error, Exception) as e:
-            logging.debug(f"Failed to check game process: {e}")
-            return False
-        return False
+            threads = process.threads()
+        except psutil.Error as e:
+            logging.debug(f"Failed to list threads of process {process.pid}: {e}")
+            self._game_processes = [p for p in self._game_processes if p is not process]
+            return None
+
+        for thread in threads:
+            try:
+                win32gui.EnumThreadWindows(thread.id, enum_windows_callback, None)
+            except _WindowFoundError as found:
+                return found.hwnd
+            except win32gui.error as e:
+                # Threads without windows report an error, skip them
+                logging.debug(f"Failed to enumerate windows of thread {thread.id}: {e}")
+        return None
 
     def find_window(self) -> bool:
         """Find the Path of Exile 2 window.
 
+        Only the windows owned by the game process threads are checked, so no
+        other process has to be opened or queried, and the enumeration stops at
+        the first matching window.
+
         Returns:
             bool: True if the window was found, False otherwise.
         """
@@ -77,35 +115,14 @@ class GameWindow:
             return False
 
         try:
-            # Get all top-level windows
-            def enum_windows_callback(hwnd: int, windows: list[int]) -> bool:
-                if win32gui.IsWindow(hwnd) and win32gui.IsWindowVisible(hwnd):
-                    windows.append(hwnd)
-                return True
-
-            windows: list[int] = []
-            win32gui.EnumWindows(enum_windows_callback, windows)
-
-            # Check each window
-            logging.debug(f"Found {len(windows)} windows to check")
-            for hwnd in windows:
-                try:
-                    title = win32gui.GetWindowText(hwnd)
-                    logging.debug(f"Checking window: '{title}' against '{self._title}'")
-
-                    if title == self._title:
-                        logging.debug("Found matching window title, checking process...")
-                        process_match = self._is_game_process(hwnd)
-                        logging.debug(f"Process match result: {process_match}")
-                        if process_match:
-                            logging.debug("Found matching process")
-                            self._hwnd = hwnd
-                            return True
-                        else:
-                            logging.debug("Process did not match")
-                except Exception as e:
-                    logging.debug(f"Error checking window {hwnd}: {e}")
-                    continue
+            processes = self._find_game_processes()
+            logging.debug(f"Found {len(processes)} processes matching {self._exe_name}")
+            for process in processes:
+                hwnd = self._find_process_window(process, self._title)
+                if hwnd is not None:
+                    logging.debug("Found matching window")
+                    self._hwnd = hwnd
+                    return True
 
             logging.debug("No matching window found")
         except Exception as e:
@@ -169,7 +186,7 @@ class GameWindow:
             return False
         try:
             if win32gui.IsIconic(self._hwnd):  # If minimized
-                win32gui.ShowWindow(self._hwnd, win32con.SW_RESTORE)
+                win32gui.ShowWindow(self._hwnd, _SW_RESTORE)
             win32gui.SetForegroundWindow(self._hwnd)
         except Exception:
             self._hwnd = None
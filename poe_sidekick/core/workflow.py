@@ -5,11 +5,10 @@ multiple modules to accomplish complex tasks. It handles module activation,
 deactivation, error handling, and resource cleanup.
 """
 
+import asyncio
 import logging
 from collections.abc import Sequence
-from typing import Any
-
-from poe_sidekick.core.module import BaseModule
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +30,15 @@ class ModuleActivationError(WorkflowError):
         self.message = f"Failed to activate workflow modules: {error}"
 
 
+class SupportsActivation(Protocol):
+    """Protocol defining the module interface a workflow coordinates."""
+
+    active: bool
+
+    async def activate(self) -> None: ...
+    async def deactivate(self) -> None: ...
+
+
 class BaseWorkflow:
     """Base class for implementing workflows that coordinate multiple modules.
 
@@ -54,58 +62,68 @@ class BaseWorkflow:
                     await self.deactivate_modules()
     """
 
-    def __init__(self, modules: Sequence[BaseModule]) -> None:
+    __slots__ = ("_failed_activations", "_stop_event", "active", "modules")
+
+    def __init__(self, modules: Sequence[SupportsActivation]) -> None:
         """Initialize the workflow with a sequence of modules.
 
         Args:
-            modules: Sequence of BaseModule instances that this workflow will coordinate
+            modules: Sequence of modules, such as BaseModule instances, that this workflow will coordinate
         """
         self.modules = list(modules)
         self.active = False
-        self._failed_activations: list[BaseModule] = []
+        self._failed_activations: list[SupportsActivation] = []
+        # Set by stop() to let execute() return without polling
+        self._stop_event = asyncio.Event()
+
+    def stop(self) -> None:
+        """Request the workflow to stop.
+
+        Wakes up execute() implementations waiting on the stop event so they
+        can deactivate their modules and return.
+        """
+        self._stop_event.set()
 
     async def activate_modules(self) -> None:
         """Activate all modules required for this workflow.
 
-        This method attempts to activate all modules in sequence. If any module
-        fails to activate, all previously activated modules are deactivated
-        before raising the error.
+        Inactive modules are activated concurrently. If any module fails to
+        activate, all modules that were activated by this call are deactivated
+        before raising the first error.
 
         Raises:
             ModuleActivationError: If any module fails to activate
         """
-        self._failed_activations = []
-
-        try:
-            for module in self.modules:
-                if not module.active:
-                    await module.activate()
-                    self._failed_activations.append(module)
-
+        pending = [module for module in self.modules if not module.active]
+        results = await asyncio.gather(*(module.activate() for module in pending), return_exceptions=True)
+
+        self._failed_activations = [
+            module for module, result in zip(pending, results, strict=True) if not isinstance(result, BaseException)
+        ]
+        error = next((result for result in results if isinstance(result, BaseException)), None)
+        if error is None:
             self.active = True
             self._failed_activations = []
+            return
 
-        except Exception as e:
-            # If any module fails to activate, deactivate all modules that were
-            # successfully activated
-            await self._cleanup_failed_activation()
-            raise ModuleActivationError(e) from e
+        # If any module fails to activate, deactivate all modules that were
+        # successfully activated
+        await self._cleanup_failed_activation()
+        if not isinstance(error, Exception):
+            raise error
+        raise ModuleActivationError(error) from error
 
     async def deactivate_modules(self) -> None:
         """Deactivate all active modules.
 
         This method ensures all modules are deactivated, even if some
-        deactivations fail. It attempts to deactivate all modules before
-        raising any errors that occurred.
+        deactivations fail. Modules are deactivated concurrently and any
+        errors are raised once all of them have finished.
         """
-        errors: list[Exception] = []
-
-        for module in self.modules:
-            if module.active:
-                try:
-                    await module.deactivate()
-                except Exception as e:
-                    errors.append(e)
+        results = await asyncio.gather(
+            *(module.deactivate() for module in self.modules if module.active), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
 
         self.active = False
 
@@ -118,12 +136,11 @@ class BaseWorkflow:
         This method deactivates any modules that were successfully activated
         before the failure occurred.
         """
-        for module in self._failed_activations:
-            try:
-                if module.active:
-                    await module.deactivate()
-            except Exception:
-                logger.exception("Failed to deactivate module during cleanup")
+        active = [module for module in self._failed_activations if module.active]
+        results = await asyncio.gather(*(module.deactivate() for module in active), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Failed to deactivate module during cleanup", exc_info=result)
 
         self._failed_activations = []
         self.active = False
@@ -1,15 +1,22 @@
 """Loot manager module implementation."""
 
+import asyncio
+import hashlib
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TypedDict, cast
 
 import cv2
 import numpy as np
 from numpy.typing import NDArray
 
 from ...core.module import BaseModule, ModuleConfig
+from ...services.item import TemplateAsset
+from ...services.vision import OPENCL_MIN_AREA, TemplateMatch, to_umat
 
 
 class ItemInfo(TypedDict):
@@ -18,6 +25,7 @@ class ItemInfo(TypedDict):
     name: str
     location: tuple[int, int]
     confidence: float
+    threshold: float
     timestamp: float
 
 
@@ -27,6 +35,7 @@ class GroundLabelConfig(TypedDict):
     path: str
     color_range: dict[str, list[int]]
     detection_threshold: float
+    min_pixel_count: NotRequired[int]
 
 
 class TemplateData(TypedDict):
@@ -35,6 +44,262 @@ class TemplateData(TypedDict):
     ground_label: GroundLabelConfig
 
 
+@dataclass(slots=True)
+class _LootState:
+    """Per-frame state of the loot module.
+
+    Args:
+        frame_shape: Shape of the last processed frame, None before the first frame
+        detected_items: Items detected in the last processed frame
+        frame_hash: Digest of the full pixel buffer of the last processed frame
+    """
+
+    frame_shape: tuple[int, ...] | None = None
+    detected_items: list[ItemInfo] = field(default_factory=list)
+    frame_hash: bytes | None = None
+
+
+# Digest size in bytes of the frame hash used to recognize repeated frames
+FRAME_DIGEST_SIZE = 16
+
+# Templates are first matched at half resolution if they stay at least this large there
+MIN_HALF_TEMPLATE_SIZE = 8
+# Pixels around a half resolution match searched again at full resolution
+REFINE_PADDING = 4
+
+# Module configuration shared by all instances, always enabled by default
+LOOT_MODULE_CONFIG = ModuleConfig(name="loot_module", enabled=True)
+
+# Default share of a template's area that has to appear in the frame in its label color
+MIN_COLOR_PIXEL_FRACTION = 0.05
+
+# Largest random offset in pixels applied to pickup clicks, and how many offsets are pregenerated
+CLICK_JITTER = 3
+JITTER_BUFFER_SIZE = 1024
+
+# HSV channel order of ground label color ranges
+HSV_CHANNELS = ("hue", "saturation", "value")
+
+
+@dataclass
+class _TemplateBucket:
+    """Ground label templates sharing one shape, stacked for batched matching.
+
+    Args:
+        names: Item name of each template
+        templates: (N, height, width) stack of grayscale templates
+        lower: (N, 3) lower HSV bounds of each template's label color
+        upper: (N, 3) upper HSV bounds of each template's label color
+        thresholds: (N,) minimum confidence for each template to count as detected
+        min_pixels: (N,) number of label colored frame pixels needed to match each template
+        half_templates: (N, height / 2, width / 2) stack of the templates at half
+            resolution, None if the templates are too small to be matched there
+        half_umats: OpenCL copies of the half resolution templates, None when
+            OpenCL is not used or there are no half resolution templates
+    """
+
+    names: list[str]
+    templates: NDArray[np.uint8]
+    lower: NDArray[np.uint8]
+    upper: NDArray[np.uint8]
+    thresholds: NDArray[np.float32]
+    min_pixels: NDArray[np.int32]
+    half_templates: NDArray[np.uint8] | None = None
+    half_umats: list[cv2.UMat] | None = None
+
+    def __getitem__(self, index: slice) -> "_TemplateBucket":
+        return _TemplateBucket(
+            self.names[index],
+            self.templates[index],
+            self.lower[index],
+            self.upper[index],
+            self.thresholds[index],
+            self.min_pixels[index],
+            None if self.half_templates is None else self.half_templates[index],
+            None if self.half_umats is None else self.half_umats[index],
+        )
+
+
+def _color_bounds(config: GroundLabelConfig) -> tuple[list[int], list[int]]:
+    """Get the (lower, upper) HSV bounds of a ground label's color range, missing channels are unbounded."""
+    color_range = config.get("color_range", {})
+    bounds = [color_range.get(channel, [0, 255]) for channel in HSV_CHANNELS]
+    return [low for low, _ in bounds], [high for _, high in bounds]
+
+
+def _build_bucket(
+    entries: list[tuple[str, TemplateAsset, GroundLabelConfig]], default_threshold: float, *, use_opencl: bool = False
+) -> _TemplateBucket:
+    """Stack equally sized templates and their settings into parallel arrays.
+
+    Args:
+        entries: (item name, decoded template, ground label config) of each template
+        default_threshold: Detection threshold for templates that do not set their own
+        use_opencl: Whether to also upload the half resolution templates to the OpenCL device
+
+    Returns:
+        Template bucket with one row per entry
+    """
+    bounds = [_color_bounds(config) for _, _, config in entries]
+    height, width = entries[0][1].gray.shape[:2]
+    default_min_pixels = max(int(height * width * MIN_COLOR_PIXEL_FRACTION), 1)
+    half_templates: NDArray[np.uint8] | None = None
+    half_umats: list[cv2.UMat] | None = None
+    if min(height, width) // 2 >= MIN_HALF_TEMPLATE_SIZE:
+        # The template pyramid is built with pyrDown, like the stream's half resolution frame
+        half_templates = np.stack([asset.pyramid[1] for _, asset, _ in entries])
+        if use_opencl:
+            # Uploaded once here instead of on every frame
+            half_umats = [to_umat(template) for template in half_templates]
+    return _TemplateBucket(
+        names=[name for name, _, _ in entries],
+        templates=np.stack([asset.gray for _, asset, _ in entries]),
+        lower=np.array([lower for lower, _ in bounds], dtype=np.uint8),
+        upper=np.array([upper for _, upper in bounds], dtype=np.uint8),
+        thresholds=np.array(
+            [config.get("detection_threshold", default_threshold) for _, _, config in entries], dtype=np.float32
+        ),
+        min_pixels=np.array(
+            [config.get("min_pixel_count", default_min_pixels) for _, _, config in entries], dtype=np.int32
+        ),
+        half_templates=half_templates,
+        half_umats=half_umats,
+    )
+
+
+def _refine_match(
+    frame_gray: NDArray[np.uint8], template: NDArray[np.uint8], x: int, y: int
+) -> tuple[float, tuple[int, int]]:
+    """Match a template at full resolution around a half resolution match.
+
+    Args:
+        frame_gray: Full resolution grayscale frame
+        template: Full resolution template
+        x: Column of the half resolution match, in full resolution pixels
+        y: Row of the half resolution match, in full resolution pixels
+
+    Returns:
+        Tuple of the full resolution confidence and (x, y) location in the frame
+    """
+    height, width = template.shape[:2]
+    left = max(x - REFINE_PADDING, 0)
+    top = max(y - REFINE_PADDING, 0)
+    window = frame_gray[top : y + height + REFINE_PADDING, left : x + width + REFINE_PADDING]
+    result = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return float(max_val), (left + max_loc[0], top + max_loc[1])
+
+
+def _locate_half(
+    frame_half: NDArray[np.uint8] | cv2.UMat, template: NDArray[np.uint8], template_umat: cv2.UMat | None
+) -> tuple[int, int]:
+    """Get the (x, y) of a half resolution template's best match, on the OpenCL device if the frame is there.
+
+    Args:
+        frame_half: Grayscale frame at half resolution, as a UMat when on the OpenCL device
+        template: Half resolution template
+        template_umat: Cached OpenCL copy of the template, uploaded on the fly when None
+
+    Returns:
+        (x, y) of the best match in the half resolution frame
+    """
+    if isinstance(frame_half, cv2.UMat):
+        device_template = template_umat if template_umat is not None else to_umat(template)
+        # Only the small correlation map comes back to the host
+        result = cv2.matchTemplate(frame_half, device_template, cv2.TM_CCOEFF_NORMED).get()
+    else:
+        result = cv2.matchTemplate(frame_half, template, cv2.TM_CCOEFF_NORMED)
+    _, _, _, max_loc = cv2.minMaxLoc(result)
+    return max_loc[0], max_loc[1]
+
+
+def _color_pixel_counts(frame_hsv: NDArray[np.uint8], bucket: _TemplateBucket) -> NDArray[np.intp]:
+    """Count the frame pixels in each template's label color.
+
+    The frame is masked once per distinct color range, templates sharing a
+    range share the count.
+
+    Args:
+        frame_hsv: HSV version of the frame
+        bucket: Templates whose color ranges to count
+
+    Returns:
+        (N,) number of frame pixels in each template's color range
+    """
+    bounds = np.concatenate([bucket.lower, bucket.upper], axis=1)
+    ranges, range_index = np.unique(bounds, axis=0, return_inverse=True)
+    counts = np.array([
+        cv2.countNonZero(cv2.inRange(frame_hsv, low, high))
+        for low, high in zip(ranges[:, :3], ranges[:, 3:], strict=True)
+    ])
+    return counts[range_index.reshape(-1)]
+
+
+def _match_templates(
+    frame_gray: NDArray[np.uint8],
+    frame_half: NDArray[np.uint8] | cv2.UMat,
+    frame_hsv: NDArray[np.uint8],
+    bucket: _TemplateBucket,
+) -> tuple[NDArray[np.float32], NDArray[np.int32]]:
+    """Match a stack of equally sized templates against a frame.
+
+    Templates whose label color covers fewer frame pixels than the label
+    itself needs cannot match, so they are rejected with a cheap color mask,
+    computed once per distinct color range, before matching.
+    Templates large enough are located on the half resolution frame, touching
+    a quarter of the pixels, and only scored at full resolution around that spot.
+
+    Args:
+        frame_gray: Grayscale frame to search
+        frame_half: Grayscale frame at half resolution, on the OpenCL device for large frames
+        frame_hsv: HSV version of the frame for the color prefilter
+        bucket: Templates to match
+
+    Returns:
+        Tuple of (N,) best match confidences and (N, 2) best match locations,
+        rejected templates have a confidence of 0
+    """
+    confidences = np.zeros(len(bucket.names), dtype=np.float32)
+    locations = np.zeros((len(bucket.names), 2), dtype=np.int32)
+    candidates = np.flatnonzero(_color_pixel_counts(frame_hsv, bucket) >= bucket.min_pixels)
+    for i in candidates.tolist():
+        template = bucket.templates[i]
+        if bucket.half_templates is None:
+            result = cv2.matchTemplate(frame_gray, template, cv2.TM_CCOEFF_NORMED)
+            _, confidences[i], _, locations[i] = cv2.minMaxLoc(result)
+            continue
+        template_umat = None if bucket.half_umats is None else bucket.half_umats[i]
+        x, y = _locate_half(frame_half, bucket.half_templates[i], template_umat)
+        confidences[i], locations[i] = _refine_match(frame_gray, template, x * 2, y * 2)
+    return confidences, locations
+
+
+def _finalize_detections(
+    locations: NDArray[np.int32],
+    confidences: NDArray[np.float32],
+    region_x: int,
+    region_y: int,
+    jitter: NDArray[np.int32],
+    thresholds: NDArray[np.float32],
+) -> tuple[NDArray[np.int32], NDArray[np.bool_]]:
+    """Convert frame detections to screen click coordinates.
+
+    Args:
+        locations: (N, 2) array of detection coordinates within the frame
+        confidences: (N,) array of detection confidences
+        region_x: Left offset of the capture region on screen
+        region_y: Top offset of the capture region on screen
+        jitter: (N, 2) array of random click offsets for natural clicks
+        thresholds: (N,) array of the minimum confidence of each detection's template
+
+    Returns:
+        Tuple of (N, 2) click coordinates and (N,) mask of detections above threshold
+    """
+    click_xy = locations + np.array([region_x, region_y], dtype=np.int32) + jitter
+    mask = confidences >= thresholds
+    return click_xy, mask
+
+
 class LootModule(BaseModule):
     """Module for detecting and managing loot items.
 
@@ -50,19 +315,19 @@ class LootModule(BaseModule):
         Args:
             services: Dictionary of service instances including:
                      - vision_service: For item detection
+                     - template_service: For ground label metadata and template images
                      - input_service: For item pickup
         """
         # Load module configuration
         config_path = Path(__file__).parent.parent.parent / "config" / "loot_module.json"
-        with open(config_path) as f:
-            module_config = json.load(f)
+        # Parse the raw bytes directly, skipping the text decoding layer
+        module_config = json.loads(config_path.read_bytes())
 
-        config = ModuleConfig(name="loot_module", enabled=True)  # Always enabled by default
-        super().__init__(config, services)
+        super().__init__(LOOT_MODULE_CONFIG, services)
 
         # Get required services
         self.vision_service = services["vision_service"]
-        self.item_service = services["item_service"]
+        self.template_service = services["template_service"]
         self.input_service = services["input_service"]
         self.stream = services["stream"]  # Screenshot stream for region info
 
@@ -71,10 +336,37 @@ class LootModule(BaseModule):
         self._behavior = module_config["behavior"]
 
         # Initialize state and tracking
-        self._detected_items: list[ItemInfo] = []
+        self._loot_state = _LootState()
+        # Frames are dispatched on separate tasks, only one of them is matched at a time
+        self._frame_lock = asyncio.Lock()
         self._ground_templates: dict[str, TemplateData] = {}
+        # Template images grouped by shape, loaded once on activation
+        self._template_buckets: dict[tuple[int, int], _TemplateBucket] = {}
         self._last_frame: NDArray[np.uint8] | None = None
-        self.update_state({"frame_shape": None, "detected_items": self._detected_items})
+
+        # Templates are matched independently; cv2.matchTemplate releases the GIL
+        self._workers = os.cpu_count() or 1
+        self._use_opencl = cv2.ocl.haveOpenCL()
+
+        # Click offsets are drawn once and cycled through, instead of sampled on every pickup
+        self._jitter = np.random.default_rng().integers(
+            -CLICK_JITTER, CLICK_JITTER + 1, size=(JITTER_BUFFER_SIZE, 2), dtype=np.int32
+        )
+        self._jitter_index = 0
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="loot_match")
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Get module state.
+
+        Returns:
+            A copy of the current state dictionary, including the frame shape and detected items
+        """
+        return {
+            **super().state,
+            "frame_shape": self._loot_state.frame_shape,
+            "detected_items": self._loot_state.detected_items,
+        }
 
     async def _process_frame(self, frame: NDArray[np.uint8]) -> None:
         """Process a screenshot frame to detect and filter items.
@@ -87,145 +379,277 @@ class LootModule(BaseModule):
         if frame is None:
             return
 
+        # Matching awaits the thread pool, a frame arriving meanwhile is dropped rather than queued
+        if self._frame_lock.locked():
+            self.logger.debug("Previous frame still processing, dropping frame")
+            return
+        async with self._frame_lock:
+            await self._detect_items(frame)
+
+    async def _detect_items(self, frame: NDArray[np.uint8]) -> None:
+        """Detect items in a frame and pick them up if auto-pickup is enabled.
+
+        Args:
+            frame: Screenshot frame as numpy array
+        """
         self._last_frame = frame
-        self._detected_items.clear()
 
-        if not self._ground_templates:
+        # An unchanged frame yields the same detections, keep the previous results.
+        # Every pixel is hashed, small changes like a new item label must not be skipped.
+        frame_hash = hashlib.blake2b(np.ascontiguousarray(frame).data, digest_size=FRAME_DIGEST_SIZE).digest()
+        if frame_hash == self._loot_state.frame_hash:
+            self.logger.debug("Frame unchanged, skipping frame processing")
+            return
+        self._loot_state.frame_hash = frame_hash
+        # Each frame collects into its own list, the previous frame's list is left untouched
+        detected_items: list[ItemInfo] = []
+        self._loot_state.detected_items = detected_items
+
+        if not self._template_buckets:
             self.logger.debug("No ground templates loaded, skipping frame processing")
             return
 
-        # Perform template matching for each ground label
-        for item_name, template_data in self._ground_templates.items():
-            try:
-                # Convert relative path to absolute using project root
-                relative_path = template_data["ground_label"]["path"]
-                project_root = Path(__file__).parent.parent.parent.parent
-                template_path = project_root / relative_path
-
-                self.logger.debug(f"Looking for template at: {template_path}")
-                if not template_path.exists():
-                    self.logger.warning(f"Template file not found: {template_path}")
-                    continue
-
-                # Load template image
-                template = cv2.imread(str(template_path))
-                if template is None:
-                    self.logger.warning(f"Failed to load template: {template_path}")
-                    continue
-
-                template_array = np.asarray(template, dtype=np.uint8)
-                self.logger.debug(f"Successfully loaded template: {template_path} with shape {template_array.shape}")
-
-                # Save debug images if needed
-                screenshots_dir = Path("data/screenshots")
-                screenshots_dir.mkdir(parents=True, exist_ok=True)
-                timestamp = int(time.time() * 1000)
-
-                # Save original frame and template
-                cv2.imwrite(str(screenshots_dir / f"frame_{timestamp}.png"), frame)
-                cv2.imwrite(str(screenshots_dir / f"template_{timestamp}.png"), template_array)
-
-                # Simple template matching on raw images
-                threshold = self._behavior["detection_threshold"]
-                threshold = self._behavior["detection_threshold"]
-                self.logger.debug(f"Attempting template match for {item_name} with threshold {threshold}")
-                self.logger.debug(f"Template shape: {template_array.shape}, Frame shape: {frame.shape}")
-
-                match = await self.vision_service.find_template(template_array, frame, threshold=threshold)
-
-                if match:
-                    # Draw match location on frame for debugging
-                    debug_frame = frame.copy()
-                    h, w = template_array.shape[:2]
-                    x, y = match.location
-                    cv2.rectangle(debug_frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-                    cv2.circle(debug_frame, match.location, 5, (0, 0, 255), -1)
-                    cv2.putText(
-                        debug_frame,
-                        f"{match.confidence:.2f}",
-                        (x, y - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (255, 255, 255),
-                        1,
-                    )
-                    cv2.imwrite(str(screenshots_dir / f"match_{timestamp}.png"), debug_frame)
-
-                    # Add detected item
-                    item_info: ItemInfo = {
-                        "name": item_name,
-                        "location": match.location,
-                        "confidence": match.confidence,
-                        "timestamp": time.time(),
-                    }
-                    self._detected_items.append(item_info)
-                    self.logger.info(
-                        f"Detected item: {item_name} at {match.location} with confidence {match.confidence:.2f}"
+        frame_gray = self._gray_frame(frame)
+        frame_half = self._half_frame(frame, frame_gray)
+        frame_search: NDArray[np.uint8] | cv2.UMat = frame_half
+        if self._use_opencl and frame_half.size >= OPENCL_MIN_AREA:
+            # Upload once, every half resolution search of this frame then runs on the device
+            frame_search = to_umat(frame_half)
+        chunks = self._template_chunks(frame_gray.shape[:2])
+
+        # Match template chunks concurrently on the thread pool
+        loop = asyncio.get_running_loop()
+        frame_hsv = cast(
+            NDArray[np.uint8], await loop.run_in_executor(self._pool, cv2.cvtColor, frame, cv2.COLOR_BGR2HSV)
+        )
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._pool, _match_templates, frame_gray, frame_search, frame_hsv, chunk)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+        # Only matches above their template's threshold are post-processed on the event loop thread
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error matching templates {chunk.names}", exc_info=result)
+                continue
+            confidences, locations = result
+            for i in np.flatnonzero(confidences >= chunk.thresholds).tolist():
+                try:
+                    item_info = await self._handle_match_result(
+                        chunk.names[i],
+                        chunk.templates.shape[1:],
+                        float(confidences[i]),
+                        float(chunk.thresholds[i]),
+                        tuple(locations[i].tolist()),
+                        frame,
                     )
+                    detected_items.append(item_info)
+                except Exception:
+                    self.logger.exception(f"Error processing template {chunk.names[i]}")
 
-                    # Try to pick up item if auto-pickup is enabled
-                    if self._behavior["auto_pickup"]:
-                        await self._pickup_item(item_info)
+        # Try to pick up detected items if auto-pickup is enabled
+        if detected_items and self._behavior["auto_pickup"]:
+            await self._pickup_items(detected_items)
 
-                    # Try to pick up item if auto-pickup is enabled
-                    if self._behavior["auto_pickup"]:
-                        await self._pickup_item(item_info)
+        # Update state with current frame info
+        self._loot_state.frame_shape = frame.shape
 
-            except Exception:
-                self.logger.exception(f"Error processing template {item_name}")
+    def _gray_frame(self, frame: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Get the grayscale version of a frame.
 
-        # Update state with current frame info and detections
-        self.update_state({
-            "frame_shape": frame.shape,
-            "detected_items": self._detected_items,
-        })
+        Reuses the stream's shared frame bundle when it still refers to this
+        frame, so the conversion is done once per capture for all consumers.
+        The bundle is rewritten in place on the next capture, so a private copy
+        is returned for use across awaits.
 
-    async def _pickup_item(self, item_info: ItemInfo) -> None:
-        """Attempt to pick up a detected item.
+        Args:
+            frame: Screenshot frame as numpy array
+
+        Returns:
+            Grayscale frame
+        """
+        bundle = self.stream.current_bundle
+        if bundle is not None and bundle.bgr is frame:
+            return cast(NDArray[np.uint8], bundle.gray.copy())
+        return cast(NDArray[np.uint8], cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+
+    def _half_frame(self, frame: NDArray[np.uint8], frame_gray: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Get the grayscale frame at half resolution, copied from the shared frame bundle when possible.
 
         Args:
-            item_info: Dictionary containing item detection information
+            frame: Screenshot frame as numpy array
+            frame_gray: Grayscale version of the frame
+
+        Returns:
+            Grayscale frame downsampled by two
         """
-        try:
-            # Get item location and convert to screen coordinates
-            frame_x, frame_y = item_info["location"]
+        bundle = self.stream.current_bundle
+        if bundle is not None and bundle.bgr is frame and len(bundle.pyr_gray) > 1:
+            return cast(NDArray[np.uint8], bundle.pyr_gray[1].copy())
+        return cast(NDArray[np.uint8], cv2.pyrDown(frame_gray))
 
-            # Get capture region from stream
-            region = self.stream._camera.region if self.stream._camera else None
-            if not region:
-                self.logger.error("No capture region available")
-                return
+    def _template_chunks(self, frame_shape: tuple[int, ...]) -> list[_TemplateBucket]:
+        """Split the template buckets into chunks for the matching thread pool.
 
-            # Convert frame coordinates to screen coordinates
-            screen_x = frame_x + region[0]  # Add left offset
-            screen_y = frame_y + region[1]  # Add top offset
+        Args:
+            frame_shape: (height, width) of the frame to search
 
-            self.logger.debug(
-                f"Converting coordinates for {item_info["name"]}: "
-                f"frame({frame_x}, {frame_y}) -> screen({screen_x}, {screen_y})"
-            )
+        Returns:
+            List of template chunks, each with a single template shape
+        """
+        chunks: list[_TemplateBucket] = []
+        for (height, width), bucket in self._template_buckets.items():
+            if height > frame_shape[0] or width > frame_shape[1]:
+                self.logger.debug(f"Skipping {bucket.names}, templates are larger than the frame")
+                continue
+            size = -(-len(bucket.names) // self._workers)
+            for start in range(0, len(bucket.names), size):
+                chunks.append(bucket[start : start + size])
+        return chunks
+
+    def _load_template_buckets(self) -> dict[tuple[int, int], _TemplateBucket]:
+        """Group the decoded ground label templates by shape.
+
+        Returns:
+            Template buckets keyed by (height, width)
+        """
+        grouped: dict[tuple[int, int], list[tuple[str, TemplateAsset, GroundLabelConfig]]] = {}
+        for item_name, template_data in self._ground_templates.items():
+            # Images were decoded by the template service when the metadata was loaded
+            asset = self.template_service.get_template(item_name)
+            if asset is None:
+                self.logger.warning(f"No ground label image loaded for {item_name}")
+                continue
+            entry = (item_name, asset, template_data["ground_label"])
+            grouped.setdefault(asset.gray.shape[:2], []).append(entry)
+
+        default_threshold = self._behavior["detection_threshold"]
+        return {
+            shape: _build_bucket(entries, default_threshold, use_opencl=self._use_opencl)
+            for shape, entries in grouped.items()
+        }
+
+    async def _handle_match_result(
+        self,
+        item_name: str,
+        template_shape: tuple[int, ...],
+        confidence: float,
+        threshold: float,
+        location: tuple[int, ...],
+        frame: NDArray[np.uint8],
+    ) -> ItemInfo:
+        """Turn a template match above the detection threshold into a detected item.
+
+        Args:
+            item_name: Name of the matched item
+            template_shape: (height, width) of the template that was matched
+            confidence: Match confidence
+            threshold: Detection threshold of the matched template
+            location: (x, y) of the match in the frame
+            frame: Frame the template was matched against
+
+        Returns:
+            Detected item information
+        """
+        self.logger.debug(f"Template shape: {template_shape}, Frame shape: {frame.shape}")
+        match = TemplateMatch(location=(int(location[0]), int(location[1])), confidence=confidence)
+
+        # Draw match location on frame for debugging
+        screenshots_dir = Path("data/screenshots")
+        screenshots_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = int(time.time() * 1000)
+        debug_frame = frame.copy()
+        h, w = template_shape[:2]
+        x, y = match.location
+        cv2.rectangle(debug_frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+        cv2.circle(debug_frame, match.location, 5, (0, 0, 255), -1)
+        cv2.putText(
+            debug_frame,
+            f"{match.confidence:.2f}",
+            (x, y - 10),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            (255, 255, 255),
+            1,
+        )
+        cv2.imwrite(str(screenshots_dir / f"match_{timestamp}.png"), debug_frame)
+
+        # Add detected item
+        item_info: ItemInfo = {
+            "name": item_name,
+            "location": match.location,
+            "confidence": match.confidence,
+            "threshold": threshold,
+            "timestamp": time.time(),
+        }
+        self.logger.info(f"Detected item: {item_name} at {match.location} with confidence {match.confidence:.2f}")
+        return item_info
+
+    async def _pickup_items(self, items: list[ItemInfo]) -> None:
+        """Attempt to pick up detected items.
 
-            # Add small random offset for natural clicks
-            offset_x = np.random.randint(-3, 4)
-            offset_y = np.random.randint(-3, 4)
-            click_x = screen_x + offset_x
-            click_y = screen_y + offset_y
+        Args:
+            items: Detected items to pick up
+        """
+        # Get capture region from stream
+        region = self.stream._camera.region if self.stream._camera else None
+        if not region:
+            self.logger.error("No capture region available")
+            return
 
-            # Move cursor and click
-            self.input_service.move_cursor_to(click_x, click_y)
-            time.sleep(self._behavior["min_delay_seconds"])
-            self.input_service.click_left()
+        # Convert all frame coordinates to jittered screen coordinates in one pass
+        locations = np.array([item["location"] for item in items], dtype=np.int32)
+        confidences = np.array([item["confidence"] for item in items], dtype=np.float32)
+        # Each item is held to its own template's threshold, as during detection
+        thresholds = np.array([item["threshold"] for item in items], dtype=np.float32)
+        jitter = self._take_jitter(len(items))
+        click_xy, mask = _finalize_detections(locations, confidences, region[0], region[1], jitter, thresholds)
+
+        for item_info, (click_x, click_y), keep in zip(items, click_xy.tolist(), mask.tolist(), strict=True):
+            if not keep:
+                continue
+            try:
+                self.logger.debug(
+                    f"Converting coordinates for {item_info["name"]}: "
+                    f"frame{item_info["location"]} -> screen({click_x}, {click_y})"
+                )
 
-            self.logger.info(f"Attempted to pick up {item_info["name"]} at ({click_x}, {click_y})")
+                # Move cursor and click
+                self.input_service.move_cursor_to(click_x, click_y)
+                time.sleep(self._behavior["min_delay_seconds"])
+                self.input_service.click_left()
 
-        except Exception:
-            self.logger.exception(f"Error attempting to pick up item: {item_info["name"]}")
+                self.logger.info(f"Attempted to pick up {item_info["name"]} at ({click_x}, {click_y})")
+
+            except Exception:
+                self.logger.exception(f"Error attempting to pick up item: {item_info["name"]}")
+
+    def _take_jitter(self, count: int) -> NDArray[np.int32]:
+        """Take the next click offsets from the jitter ring buffer.
+
+        Args:
+            count: Number of offsets to take
+
+        Returns:
+            (count, 2) array of (x, y) click offsets
+        """
+        start = self._jitter_index
+        self._jitter_index = (start + count) % JITTER_BUFFER_SIZE
+        return np.take(self._jitter, range(start, start + count), axis=0, mode="wrap")
 
     async def _load_ground_templates(self) -> None:
         """Load ground label templates from metadata."""
         try:
-            metadata = await self.item_service.load_metadata()
-            self.logger.debug(f"Loaded metadata: {metadata}")
+            # Also decodes the template images off the event loop, once per metadata change
+            metadata = await self.template_service.load_metadata()
+            # Log a summary lazily rather than formatting the whole metadata tree on every load
+            self.logger.debug(
+                "Loaded metadata: %d templates",
+                sum(len(templates) for templates in metadata.get("templates", {}).values()),
+            )
             self._ground_templates = {}
 
             # Load templates from each category
@@ -256,13 +680,13 @@ class LootModule(BaseModule):
     async def _on_activate(self) -> None:
         """Activation handler that initializes item tracking."""
         try:
-            # Load ground label templates
+            # Load ground label templates and their images
             await self._load_ground_templates()
+            self._template_buckets = await asyncio.to_thread(self._load_template_buckets)
 
             # Reset state
-            self._detected_items = []
+            self._loot_state = _LootState()
             self._last_frame = None
-            self.update_state({"frame_shape": None, "detected_items": self._detected_items})
             self.logger.info("Loot module activated")
 
         except Exception:
@@ -271,12 +695,14 @@ class LootModule(BaseModule):
 
     async def _on_deactivate(self) -> None:
         """Deactivation handler that cleans up state."""
-        self._detected_items = []
+        self._loot_state = _LootState()
         self._last_frame = None
         self._ground_templates = {}
+        self._template_buckets = {}
         self.logger.info("Loot module deactivated")
 
     async def cleanup(self) -> None:
         """Clean up resources and deactivate module."""
         if self.active:
             await self.deactivate()
+        self._pool.shutdown(wait=False, cancel_futures=True)
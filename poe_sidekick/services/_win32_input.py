@@ -0,0 +1,267 @@
+"""Low-level Win32 input backend built on user32.SendInput.
+
+This module issues mouse and keyboard events directly through ctypes,
+avoiding the per-call overhead of higher level automation libraries.
+"""
+
+import ctypes
+from ctypes import wintypes
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_MIDDLEDOWN = 0x0020
+MOUSEEVENTF_MIDDLEUP = 0x0040
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+# Per monitor DPI awareness, pseudo handle value defined by windef.h
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+# Mouse button name -> (down flag, up flag)
+_BUTTON_FLAGS: dict[str, tuple[int, int]] = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP),
+}
+
+# VkKeyScanW shift state bits -> modifier virtual-key codes (shift, ctrl, alt)
+_SHIFT_STATE_KEYS = ((0x01, 0x10), (0x02, 0x11), (0x04, 0x12))
+
+# Named keys -> virtual-key codes
+VK_CODES: dict[str, int] = {
+    "backspace": 0x08,
+    "tab": 0x09,
+    "enter": 0x0D,
+    "return": 0x0D,
+    "shift": 0x10,
+    "ctrl": 0x11,
+    "alt": 0x12,
+    "pause": 0x13,
+    "capslock": 0x14,
+    "esc": 0x1B,
+    "escape": 0x1B,
+    "space": 0x20,
+    "pageup": 0x21,
+    "pagedown": 0x22,
+    "end": 0x23,
+    "home": 0x24,
+    "left": 0x25,
+    "up": 0x26,
+    "right": 0x27,
+    "down": 0x28,
+    "insert": 0x2D,
+    "delete": 0x2E,
+    **{f"f{i}": 0x6F + i for i in range(1, 13)},
+}
+
+
+class UnknownMouseButtonError(ValueError):
+    """Raised when a mouse button name is not recognized."""
+
+    def __init__(self, button: str) -> None:
+        super().__init__(f"Unknown mouse button: {button}")
+
+
+class UnknownKeyError(ValueError):
+    """Raised when a key cannot be mapped to a virtual-key code."""
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"Unknown key: {key}")
+
+
+class MOUSEINPUT(ctypes.Structure):
+    """Win32 MOUSEINPUT structure."""
+
+    _fields_ = (
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    )
+
+
+class KEYBDINPUT(ctypes.Structure):
+    """Win32 KEYBDINPUT structure."""
+
+    _fields_ = (
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    )
+
+
+class _InputUnion(ctypes.Union):
+    _fields_ = (("mi", MOUSEINPUT), ("ki", KEYBDINPUT))
+
+
+class INPUT(ctypes.Structure):
+    """Win32 INPUT structure."""
+
+    _fields_ = (("type", wintypes.DWORD), ("union", _InputUnion))
+
+
+user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+user32.SendInput.restype = wintypes.UINT
+user32.VkKeyScanW.argtypes = (wintypes.WCHAR,)
+user32.VkKeyScanW.restype = ctypes.c_short
+user32.SetProcessDPIAware.restype = wintypes.BOOL
+
+
+def enable_dpi_awareness() -> None:
+    """Make the process DPI aware so screen coordinates are physical pixels.
+
+    Without it, cursor positions, virtual screen metrics and SendInput
+    coordinates are scaled to logical pixels on scaled displays, while
+    captured frames are in physical pixels. Must be called before any
+    window or input API is used.
+    """
+    try:
+        set_context = user32.SetProcessDpiAwarenessContext
+    except AttributeError:
+        # Windows before 10 1703 only support system wide awareness
+        set_context = None
+    if set_context is not None:
+        set_context.argtypes = (wintypes.HANDLE,)
+        set_context.restype = wintypes.BOOL
+        if set_context(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2):
+            return
+    user32.SetProcessDPIAware()
+
+
+def _send(*inputs: INPUT) -> None:
+    """Send a batch of input events.
+
+    Raises:
+        OSError: If Windows rejected any of the events
+    """
+    count = len(inputs)
+    array = (INPUT * count)(*inputs)
+    if user32.SendInput(count, array, ctypes.sizeof(INPUT)) != count:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def _mouse_input(flags: int, dx: int = 0, dy: int = 0) -> INPUT:
+    return INPUT(type=INPUT_MOUSE, union=_InputUnion(mi=MOUSEINPUT(dx=dx, dy=dy, dwFlags=flags)))
+
+
+def _key_input(vk: int = 0, scan: int = 0, flags: int = 0) -> INPUT:
+    return INPUT(type=INPUT_KEYBOARD, union=_InputUnion(ki=KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)))
+
+
+def _button_flags(button: str) -> tuple[int, int]:
+    try:
+        return _BUTTON_FLAGS[button]
+    except KeyError:
+        raise UnknownMouseButtonError(button) from None
+
+
+def cursor_position() -> tuple[int, int]:
+    """Get the current cursor position in screen coordinates."""
+    point = wintypes.POINT()
+    if not user32.GetCursorPos(ctypes.byref(point)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return (point.x, point.y)
+
+
+def move_to(x: int, y: int) -> None:
+    """Move the cursor to absolute screen coordinates.
+
+    Args:
+        x: Target x coordinate
+        y: Target y coordinate
+    """
+    # Absolute coordinates are normalized to 0..65535 across the virtual desktop
+    left = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
+    top = user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
+    width = max(user32.GetSystemMetrics(SM_CXVIRTUALSCREEN) - 1, 1)
+    height = max(user32.GetSystemMetrics(SM_CYVIRTUALSCREEN) - 1, 1)
+    dx = round((x - left) * 65535 / width)
+    dy = round((y - top) * 65535 / height)
+    _send(_mouse_input(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK, dx, dy))
+
+
+def mouse_down(button: str = "left") -> None:
+    """Press a mouse button ("left", "right" or "middle")."""
+    _send(_mouse_input(_button_flags(button)[0]))
+
+
+def mouse_up(button: str = "left") -> None:
+    """Release a mouse button ("left", "right" or "middle")."""
+    _send(_mouse_input(_button_flags(button)[1]))
+
+
+def click(button: str = "left") -> None:
+    """Click a mouse button ("left", "right" or "middle")."""
+    down, up = _button_flags(button)
+    _send(_mouse_input(down), _mouse_input(up))
+
+
+def key_to_vk(key: str) -> tuple[int, tuple[int, ...]]:
+    """Translate a key name or single character to a virtual-key code.
+
+    Args:
+        key: Key name like 'enter', 'space', 'f1', or a single character
+
+    Returns:
+        Tuple of the virtual-key code and the modifier virtual-key codes that
+        have to be held to produce the character, e.g. shift for 'A' or '!'
+
+    Raises:
+        UnknownKeyError: If the key cannot be mapped to a virtual-key code
+    """
+    vk = VK_CODES.get(key.lower())
+    if vk is not None:
+        return vk, ()
+    if len(key) == 1:
+        scan = user32.VkKeyScanW(key)
+        if scan != -1:
+            # Low byte is the key, high byte the shift state needed for this character
+            shift_state = (scan >> 8) & 0xFF
+            modifiers = tuple(modifier for bit, modifier in _SHIFT_STATE_KEYS if shift_state & bit)
+            return int(scan & 0xFF), modifiers
+    raise UnknownKeyError(key)
+
+
+def key_down(vk: int, modifiers: tuple[int, ...] = ()) -> None:
+    """Press a key by virtual-key code, pressing its modifiers first."""
+    _send(*(_key_input(vk=modifier) for modifier in modifiers), _key_input(vk=vk))
+
+
+def key_up(vk: int, modifiers: tuple[int, ...] = ()) -> None:
+    """Release a key by virtual-key code, releasing its modifiers afterwards."""
+    _send(
+        _key_input(vk=vk, flags=KEYEVENTF_KEYUP),
+        *(_key_input(vk=modifier, flags=KEYEVENTF_KEYUP) for modifier in reversed(modifiers)),
+    )
+
+
+def type_char(char: str) -> None:
+    """Type a single unicode character independent of keyboard layout."""
+    # Characters outside the BMP are sent as a UTF-16 surrogate pair
+    encoded = char.encode("utf-16-le")
+    events: list[INPUT] = []
+    for i in range(0, len(encoded), 2):
+        code = int.from_bytes(encoded[i : i + 2], "little")
+        events.append(_key_input(scan=code, flags=KEYEVENTF_UNICODE))
+        events.append(_key_input(scan=code, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    _send(*events)
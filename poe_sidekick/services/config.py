@@ -1,8 +1,24 @@
+import asyncio
+import copy
+import functools
 import json
 import os
 from typing import Any
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a configuration file.
+
+    Modification time and size are part of the cache key only, so an
+    unchanged file is parsed once per process and edits invalidate it.
+    """
+    # Parse the raw bytes directly, skipping the text decoding layer
+    with open(path, "rb") as f:
+        config: dict[str, Any] = json.loads(f.read())
+    return config
+
+
 class ConfigService:
     """Service for managing configuration values across the application."""
 
@@ -34,10 +50,24 @@ class ConfigService:
         """
         if name not in self._configs:
             path = custom_path if custom_path else os.path.join(self._config_dir, f"{name}.json")
-            with open(path) as f:
-                self._configs[name] = json.load(f)
+            # File access runs in a worker thread to keep the event loop responsive
+            self._configs[name] = await asyncio.to_thread(self._read_config, path)
         return self._configs[name]
 
+    @staticmethod
+    def _read_config(path: str) -> dict[str, Any]:
+        """Read and parse a configuration file.
+
+        Args:
+            path: Full path to the config file
+
+        Returns:
+            Dict containing the configuration values
+        """
+        stat = os.stat(path)
+        # Callers get their own copy, the parsed original is shared between service instances
+        return copy.deepcopy(_parse_config(path, stat.st_mtime_ns, stat.st_size))
+
     def get_value(self, config: str, path: str, default: Any = None) -> Any:
         """Get a value from a config using dot notation path.
 
@@ -1,12 +1,9 @@
 """Input service for interacting with game through mouse and keyboard inputs."""
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-import pyautogui  # We'll need to add this to dependencies
-
-# Type alias for key inputs
-KeyType = str  # pyautogui expects string keys only
+from poe_sidekick.services import _win32_input
 
 
 @dataclass
@@ -17,11 +14,22 @@ class InputConfig:
         min_delay_seconds: Minimum delay between actions
         cursor_speed: Movement speed multiplier (1.0 = normal speed)
         key_press_duration: Default duration for key presses in seconds
+        failsafe_enabled: Abort input when the cursor is moved onto a failsafe point
+        failsafe_points: Screen coordinates that trigger the failsafe
     """
 
     min_delay_seconds: float = 0.05
     cursor_speed: float = 1.0
     key_press_duration: float = 0.1
+    failsafe_enabled: bool = True
+    failsafe_points: list[tuple[int, int]] = field(default_factory=lambda: [(0, 0)])
+
+
+class InputFailSafeError(RuntimeError):
+    """Raised when the cursor is moved onto a failsafe point to abort input."""
+
+    def __init__(self, position: tuple[int, int]) -> None:
+        super().__init__(f"Input failsafe triggered by cursor at {position}")
 
 
 class InputService:
@@ -36,12 +44,10 @@ class InputService:
 
     def __init__(self, config: InputConfig | None = None):
         self.config = config or InputConfig()
-        self._last_action_time: float = 0
-
-        # Configure pyautogui safety
-        pyautogui.FAILSAFE = True  # Move mouse to corner to abort
-        pyautogui.MINIMUM_DURATION = self.config.min_delay_seconds
-        pyautogui.PAUSE = self.config.min_delay_seconds
+        # perf_counter timestamp before which the next action has to wait
+        self._next_action_ns = 0
+        self._min_delay_ns = int(self.config.min_delay_seconds * 1e9)
+        self._failsafe_points = {(int(x), int(y)) for x, y in self.config.failsafe_points}
 
     def get_cursor_position(self) -> tuple[int, int]:
         """Get current cursor coordinates.
@@ -49,8 +55,7 @@ class InputService:
         Returns:
             Tuple of (x, y) coordinates
         """
-        x, y = pyautogui.position()
-        return (int(x), int(y))
+        return _win32_input.cursor_position()
 
     def move_cursor_to(self, x: int, y: int) -> None:
         """Move cursor to specific screen coordinates.
@@ -60,27 +65,27 @@ class InputService:
             y: Target y coordinate
         """
         self._enforce_delay()
-        pyautogui.moveTo(x, y, duration=self.config.min_delay_seconds)
+        _win32_input.move_to(x, y)
 
     def click_left(self) -> None:
         """Perform left mouse button click."""
         self._enforce_delay()
-        pyautogui.click(button="left")
+        _win32_input.click("left")
 
     def click_right(self) -> None:
         """Perform right mouse button click."""
         self._enforce_delay()
-        pyautogui.click(button="right")
+        _win32_input.click("right")
 
     def hold_left(self) -> None:
         """Press and hold left mouse button."""
         self._enforce_delay()
-        pyautogui.mouseDown(button="left")
+        _win32_input.mouse_down("left")
 
     def release_left(self) -> None:
         """Release left mouse button."""
         self._enforce_delay()
-        pyautogui.mouseUp(button="left")
+        _win32_input.mouse_up("left")
 
     def press_key(self, key: str) -> None:
         """Press and hold a keyboard key.
@@ -89,7 +94,7 @@ class InputService:
             key: Key to press (character or key name like 'enter', 'space', etc.)
         """
         self._enforce_delay()
-        pyautogui.keyDown(key)
+        _win32_input.key_down(*_win32_input.key_to_vk(key))
 
     def release_key(self, key: str) -> None:
         """Release a keyboard key.
@@ -98,7 +103,7 @@ class InputService:
             key: Key to release (character or key name like 'enter', 'space', etc.)
         """
         self._enforce_delay()
-        pyautogui.keyUp(key)
+        _win32_input.key_up(*_win32_input.key_to_vk(key))
 
     def type_string(self, text: str, interval: float | None = None) -> None:
         """Type a string of characters with optional interval between keystrokes.
@@ -108,7 +113,11 @@ class InputService:
             interval: Optional delay between keystrokes (uses min_delay_seconds if None)
         """
         self._enforce_delay()
-        pyautogui.write(text, interval=interval or self.config.min_delay_seconds)
+        delay = interval or self.config.min_delay_seconds
+        for i, char in enumerate(text):
+            if i:
+                time.sleep(delay)
+            _win32_input.type_char(char)
 
     def tap_key(self, key: str) -> None:
         """Tap a key (press and release).
@@ -117,14 +126,33 @@ class InputService:
             key: Key to tap (character or key name like 'enter', 'space', etc.)
         """
         self._enforce_delay()
-        pyautogui.press(key)
+        vk, modifiers = _win32_input.key_to_vk(key)
+        _win32_input.key_down(vk, modifiers)
+        _win32_input.key_up(vk, modifiers)
 
-    def _enforce_delay(self) -> None:
-        """Enforce minimum delay between actions."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_action_time
+    def _check_failsafe(self) -> None:
+        """Abort input if the cursor rests on a failsafe point.
 
-        if time_since_last < self.config.min_delay_seconds:
-            time.sleep(self.config.min_delay_seconds - time_since_last)
+        Raises:
+            InputFailSafeError: If the failsafe is triggered
+        """
+        if not self.config.failsafe_enabled:
+            return
+        position = _win32_input.cursor_position()
+        if position in self._failsafe_points:
+            raise InputFailSafeError(position)
 
-        self._last_action_time = time.time()
+    def _enforce_delay(self) -> None:
+        """Enforce minimum delay between actions.
+
+        Raises:
+            InputFailSafeError: If the failsafe is triggered
+        """
+        self._check_failsafe()
+        # perf_counter is monotonic too, but unlike monotonic it has sub-millisecond resolution on Windows
+        now = time.perf_counter_ns()
+        remaining = self._next_action_ns - now
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+
+        self._next_action_ns = max(now, self._next_action_ns) + self._min_delay_ns
@@ -1,10 +1,37 @@
 """Item service implementation for managing item metadata and templates."""
 
+import asyncio
+import functools
 import json
+import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
 from poe_sidekick.services.config import ConfigService
+from poe_sidekick.services.vision import build_pyramid
+
+logger = logging.getLogger(__name__)
+
+# Template kinds an item can define, each with its own image path
+TEMPLATE_KINDS = ("item_appearance", "ground_label")
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_metadata(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a metadata file.
+
+    Modification time and size are part of the cache key only, so an
+    unchanged file is parsed once per process and edits invalidate it.
+    Every caller shares the returned dict, it must not be modified.
+    """
+    # Parse the raw bytes directly, skipping the text decoding layer
+    return cast(dict[str, Any], json.loads(path.read_bytes()))
 
 
 class ItemMetadataError(Exception):
@@ -47,6 +74,9 @@ class ItemService:
     async def load_metadata(self) -> dict[str, Any]:
         """Load item metadata from file.
 
+        The parsed metadata is cached for the whole process and only re-read
+        when the file changes, so the same dict is returned until then.
+
         Returns:
             Item metadata dictionary containing templates and configurations
 
@@ -55,17 +85,43 @@ class ItemService:
             InvalidMetadataError: If metadata file has invalid format
         """
         try:
-            with open(self._metadata_path) as f:
-                metadata = json.load(f)
-            return cast(dict[str, Any], metadata)
+            # File access runs in a worker thread to keep the event loop responsive
+            return await asyncio.to_thread(self._read_metadata)
         except FileNotFoundError as err:
             raise MetadataNotFoundError(self._metadata_path) from err
         except json.JSONDecodeError as err:
             raise InvalidMetadataError(self._metadata_path) from err
 
+    def _read_metadata(self) -> dict[str, Any]:
+        """Get the parsed metadata file, parsing it only if it changed.
+
+        Returns:
+            Parsed metadata dictionary
+        """
+        stat = os.stat(self._metadata_path)
+        return _parse_metadata(self._metadata_path, stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class TemplateAsset:
+    """Decoded template image with precomputed matching data.
+
+    Args:
+        gray: Grayscale template image
+        pyramid: Gaussian pyramid of the template, level 0 is the grayscale image itself
+    """
 
-class TemplateService:
-    """Service for managing item templates."""
+    gray: NDArray[np.uint8]
+    pyramid: list[NDArray[np.uint8]]
+
+
+class TemplateService(ItemService):
+    """Service for managing item templates.
+
+    Shares metadata loading and caching with ItemService, and decodes every
+    template image referenced by the metadata when it is (re)loaded so
+    matching never touches the disk.
+    """
 
     def __init__(self, config_service: ConfigService) -> None:
         """Initialize service with configuration.
@@ -73,24 +129,88 @@ class TemplateService:
         Args:
             config_service: Service for accessing configuration values
         """
-        self._config = config_service
-        self._metadata_path = Path(__file__).parent.parent.parent / "data" / "items" / "metadata.json"
+        super().__init__(config_service)
+        self._root = Path(__file__).parent.parent.parent
+        self._metadata_path = self._root / "data" / "templates" / "metadata.json"
+        self._templates: dict[tuple[str, str], TemplateAsset] = {}
+        self._templates_source: dict[str, Any] | None = None
+        # Flat lookup built from the metadata, template name -> config
+        self._index: dict[str, dict[str, Any]] = {}
 
     async def load_metadata(self) -> dict[str, Any]:
-        """Load item metadata from file.
+        """Load template metadata from file, index it and decode the referenced templates.
+
+        The index is rebuilt and templates decoded again only when the metadata changes.
 
         Returns:
-            Item metadata dictionary
+            Template metadata dictionary
 
         Raises:
-            FileNotFoundError: If metadata file is not found
-            ValueError: If metadata file is invalid
+            MetadataNotFoundError: If metadata file is not found
+            InvalidMetadataError: If metadata file has invalid format
         """
-        try:
-            with open(self._metadata_path) as f:
-                metadata = json.load(f)
-            return cast(dict[str, Any], metadata)
-        except FileNotFoundError as err:
-            raise MetadataNotFoundError(self._metadata_path) from err
-        except json.JSONDecodeError as err:
-            raise InvalidMetadataError(self._metadata_path) from err
+        metadata = await super().load_metadata()
+        if metadata is not self._templates_source:
+            self._index_metadata(metadata)
+            # Decoding images is blocking disk and CPU work, keep it off the event loop
+            self._templates = await asyncio.to_thread(self._load_templates)
+            self._templates_source = metadata
+        return metadata
+
+    def _index_metadata(self, metadata: dict[str, Any]) -> None:
+        """Build the flat name lookup for the metadata's templates.
+
+        Args:
+            metadata: Template metadata dictionary
+        """
+        self._index = {}
+        for items in metadata.get("templates", {}).values():
+            for name, item_config in items.items():
+                if name != "template_format":
+                    self._index[name] = item_config
+
+    def _load_templates(self) -> dict[tuple[str, str], TemplateAsset]:
+        """Decode every template image referenced by the indexed metadata.
+
+        Returns:
+            dict mapping (template name, template kind) to its decoded asset
+        """
+        templates: dict[tuple[str, str], TemplateAsset] = {}
+        for name, item_config in self._index.items():
+            for kind in TEMPLATE_KINDS:
+                if "path" not in item_config.get(kind, {}):
+                    continue
+                asset = self._load_asset(self._root / item_config[kind]["path"])
+                if asset is not None:
+                    templates[(name, kind)] = asset
+
+        logger.info(f"Loaded {len(templates)} template images")
+        return templates
+
+    def _load_asset(self, path: Path) -> TemplateAsset | None:
+        """Decode a template image and precompute its matching data.
+
+        Args:
+            path: Path to the template image
+
+        Returns:
+            TemplateAsset, or None if the image could not be read
+        """
+        gray = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            logger.warning(f"Failed to load template image: {path}")
+            return None
+
+        return TemplateAsset(gray=cast(NDArray[np.uint8], gray), pyramid=build_pyramid(cast(NDArray[np.uint8], gray)))
+
+    def get_template(self, name: str, kind: str = "ground_label") -> TemplateAsset | None:
+        """Get a decoded template.
+
+        Args:
+            name: Template name as used in the metadata
+            kind: Template kind, one of TEMPLATE_KINDS
+
+        Returns:
+            TemplateAsset, or None if the template has no loaded image
+        """
+        return self._templates.get((name, kind))
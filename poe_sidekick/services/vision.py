@@ -6,6 +6,10 @@ This service provides functionality for:
 - Game state detection
 """
 
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -16,8 +20,19 @@ import numpy as np
 import pytesseract
 from numpy.typing import NDArray
 
+try:
+    # Optional in-process OCR backend, avoids spawning the tesseract executable per call
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 from poe_sidekick.core.stream import ScreenshotStream
 
+logger = logging.getLogger(__name__)
+
+# Match cache key: (template name or identity, threshold, search region)
+_CacheKey = tuple[str | int, float, tuple[int, int, int, int] | None]
+
 
 @dataclass
 class TemplateMatch:
@@ -27,53 +42,499 @@ class TemplateMatch:
     confidence: float  # Match confidence score (0-1)
 
 
+# Number of Gaussian pyramid levels used for coarse-to-fine matching, including full resolution
+PYRAMID_LEVELS = 3
+# Templates are never downscaled below this size, smaller ones lose too much detail
+MIN_PYRAMID_TEMPLATE_SIZE = 12
+# Coarse matches this far below the threshold are rejected without refinement
+PYRAMID_MARGIN = 0.2
+# Padding in pixels around the upscaled candidate searched at each finer level
+PYRAMID_PADDING = 4
+# Smallest search area in pixels worth uploading to the GPU, below it OpenCL overhead dominates
+OPENCL_MIN_AREA = 256 * 256
+# Smoothing factor of the moving average tracking which game states won recently
+STATE_PRIOR_ALPHA = 0.2
+# (height, width) of the OCR scratch buffers, larger regions fall back to allocating
+OCR_SCRATCH_SHAPE = (512, 1024)
+
+
+def _to_gray(image: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """Convert a BGR image to grayscale, passing single-channel images through."""
+    if image.ndim == 2:
+        return image
+    return cast(NDArray[np.uint8], cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+
+
+def build_pyramid(image: NDArray[np.uint8], levels: int = PYRAMID_LEVELS) -> list[NDArray[np.uint8]]:
+    """Build a Gaussian pyramid, level 0 being the image itself.
+
+    Args:
+        image: Image to downscale
+        levels: Number of levels, including full resolution
+
+    Returns:
+        List of images, each half the size of the previous one
+    """
+    pyramid = [image]
+    for _ in range(levels - 1):
+        pyramid.append(cast(NDArray[np.uint8], cv2.pyrDown(pyramid[-1])))
+    return pyramid
+
+
+def _pyramid_levels(template: NDArray[np.uint8]) -> int:
+    """Get how many pyramid levels a template can be matched on."""
+    levels = 1
+    while levels < PYRAMID_LEVELS and min(template.shape[:2]) >> levels >= MIN_PYRAMID_TEMPLATE_SIZE:
+        levels += 1
+    return levels
+
+
+def _level_bounds(
+    region: tuple[int, int, int, int] | None, level: int, shape: tuple[int, ...]
+) -> tuple[int, int, int, int]:
+    """Get the (x0, y0, x1, y1) search bounds of a region at a pyramid level."""
+    height, width = shape[:2]
+    if region is None:
+        return 0, 0, width, height
+    x, y, w, h = region
+    # Round the far edge up so the scaled region still covers the original one
+    return (
+        max(0, x >> level),
+        max(0, y >> level),
+        min(width, -(-(x + w) >> level)),
+        min(height, -(-(y + h) >> level)),
+    )
+
+
+def _best_match(image: NDArray[np.uint8], template: NDArray[np.uint8]) -> tuple[float, tuple[int, int]] | None:
+    """Match a template and get the best (confidence, (x, y)), or None if the image is too small."""
+    if image.shape[0] < template.shape[0] or image.shape[1] < template.shape[1]:
+        return None
+
+    result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    return float(max_val), (int(max_loc[0]), int(max_loc[1]))
+
+
+def to_umat(image: NDArray[np.uint8]) -> cv2.UMat:
+    """Upload an image to the OpenCL device."""
+    # The bundled stubs lack the ndarray constructor overload
+    umat: cv2.UMat = cv2.UMat(image)  # type: ignore[call-overload]
+    return umat
+
+
+def _best_match_umat(
+    image: cv2.UMat, shape: tuple[int, int], template: NDArray[np.uint8]
+) -> tuple[float, tuple[int, int]] | None:
+    """Match a template against an OpenCL image, see _best_match.
+
+    Args:
+        image: Image to search, already on the device
+        shape: (height, width) of the image
+        template: Grayscale template image
+    """
+    if shape[0] < template.shape[0] or shape[1] < template.shape[1]:
+        return None
+
+    # Only the small correlation map comes back to the host
+    result = cv2.matchTemplate(image, to_umat(template), cv2.TM_CCOEFF_NORMED).get()
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    return float(max_val), (int(max_loc[0]), int(max_loc[1]))
+
+
+def _zero_mean(template: NDArray[np.uint8]) -> tuple[NDArray[np.float32], float]:
+    """Get a template with its mean removed, and the L2 norm of the result."""
+    centered = template.astype(np.float32)
+    centered -= centered.mean()
+    return centered, float(np.linalg.norm(centered))
+
+
+def _window_deviation(
+    integral: NDArray[np.int32],
+    integral_sq: NDArray[np.float64],
+    origin: tuple[int, int],
+    counts: tuple[int, int],
+    size: tuple[int, int],
+) -> NDArray[np.float32]:
+    """Get the L2 norm of every mean-removed window of the frame using its integral images.
+
+    Args:
+        integral: Integral image of the full frame
+        integral_sq: Squared integral image of the full frame
+        origin: (x, y) of the first window's top left corner
+        counts: Number of (rows, cols) window positions
+        size: (height, width) of a window
+
+    Returns:
+        Array of shape counts with one deviation per window position, infinite for flat windows
+    """
+    x, y = origin
+    rows, cols = counts
+    height, width = size
+
+    def window_sums(image: NDArray[Any]) -> NDArray[np.float64]:
+        # OpenCV arithmetic is vectorized and threaded, unlike chained numpy expressions
+        sums = cv2.subtract(
+            image[y + height : y + height + rows, x + width : x + width + cols],
+            image[y : y + rows, x + width : x + width + cols],
+            dtype=cv2.CV_64F,
+        )
+        sums = cv2.subtract(sums, image[y + height : y + height + rows, x : x + cols], dtype=cv2.CV_64F)
+        return cast(NDArray[np.float64], cv2.add(sums, image[y : y + rows, x : x + cols], dtype=cv2.CV_64F))
+
+    sums = window_sums(integral)
+    variance = cv2.subtract(window_sums(integral_sq), cv2.multiply(sums, sums, scale=1.0 / (height * width)))
+    np.maximum(variance, 0.0, out=variance)
+    deviation = cv2.sqrt(variance).astype(np.float32)
+    # Windows without contrast cannot be normalized, an infinite deviation scores them zero
+    deviation[deviation < 1e-3] = np.inf
+    return cast(NDArray[np.float32], deviation)
+
+
+def _match_ncc(
+    search: NDArray[np.float32],
+    origin: tuple[int, int],
+    template: NDArray[np.uint8],
+    deviation: NDArray[np.float32],
+    threshold: float,
+) -> TemplateMatch | None:
+    """Match a template with normalized cross-correlation from precomputed window statistics.
+
+    Produces the same scores as cv2.TM_CCOEFF_NORMED.
+
+    Args:
+        search: Float grayscale area of the frame to search
+        origin: (x, y) of the search area in the frame
+        template: Grayscale template image
+        deviation: Window deviations of the search area for the template's size
+        threshold: minimum confidence threshold (0-1)
+
+    Returns:
+        TemplateMatch if found above threshold, else None
+    """
+    # Correlating with a zero-mean template makes the frame's window mean cancel out
+    centered, norm = _zero_mean(template)
+    numerator = cv2.matchTemplate(search, centered, cv2.TM_CCORR)
+    scores = cv2.divide(numerator, deviation, scale=1.0 / norm if norm > 0 else 0.0)
+
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(scores)
+    if max_val < threshold:
+        return None
+
+    return TemplateMatch(location=(int(max_loc[0]) + origin[0], int(max_loc[1]) + origin[1]), confidence=float(max_val))
+
+
+async def _collect_matches(
+    futures: dict[asyncio.Future[TemplateMatch | None], str], definitive_threshold: float | None
+) -> dict[str, TemplateMatch | None]:
+    """Wait for template matches, optionally stopping at the first definitive one.
+
+    Args:
+        futures: dict mapping pending match futures to their template names
+        definitive_threshold: confidence at which a match ends the wait, None to wait for all
+
+    Returns:
+        dict mapping template names to their matches, for the matches that completed
+    """
+    found: dict[str, TemplateMatch | None] = {}
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                found[futures[future]] = future.result()
+
+            if definitive_threshold is not None and any(
+                (match := found[futures[future]]) is not None and match.confidence >= definitive_threshold
+                for future in done
+            ):
+                break
+    finally:
+        # Matches still queued on the pool cannot change the answer, and nobody reads them after an error
+        for future in pending:
+            future.cancel()
+
+    return found
+
+
 class VisionService:
     """Service for computer vision operations on game screenshots."""
 
     def __init__(self, stream: ScreenshotStream) -> None:
         self._stream = stream
         self._frame: NDArray[np.uint8] | None = None
-        self._cache: dict[str, TemplateMatch] = {}
+        self._frame_gray: NDArray[np.uint8] | None = None
+        self._frame_pyramid: list[NDArray[np.uint8]] | None = None
+        # OpenCL copies of the frame pyramid levels, uploaded on demand
+        self._use_opencl = cv2.ocl.haveOpenCL()
+        self._frame_umats: dict[int, cv2.UMat] = {}
+        # Float copy and integral images of the grayscale frame, built on demand for batched matching
+        self._frame_f32: NDArray[np.float32] | None = None
+        self._frame_integrals: tuple[NDArray[np.int32], NDArray[np.float64]] | None = None
+        # Match results keyed by (template key, threshold, region), stored as (frame id, template, match).
+        # Entries hold on to their template so its id cannot be reused while cached.
+        self._cache: dict[_CacheKey, tuple[int, NDArray[np.uint8], TemplateMatch | None]] = {}
+        self._frame_id = 0
+        self._pruned_frame_id = 0
+        # Persistent tesseract instance when tesserocr is installed and usable, pytesseract is used otherwise
+        self._tess = self._create_tesseract()
+        # Moving average of how often each game state was detected recently
+        self._state_prior: dict[str, float] = {}
+        # Alternating scratch buffers for OCR preprocessing, sized for typical text regions
+        self._ocr_buffers = (np.empty(OCR_SCRATCH_SHAPE, dtype=np.uint8), np.empty(OCR_SCRATCH_SHAPE, dtype=np.uint8))
+        # OpenCV releases the GIL while matching, so batched matches run on a thread pool
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="vision_match")
 
         # Subscribe to screenshot stream
         self._stream.observable.subscribe(self._on_frame)
 
+    @staticmethod
+    def _create_tesseract() -> Any:
+        """Create the in-process tesseract instance.
+
+        Returns:
+            tesserocr.PyTessBaseAPI, or None if tesserocr is not installed or
+            cannot initialize, e.g. when its tessdata is missing
+        """
+        if tesserocr is None:
+            return None
+        try:
+            return tesserocr.PyTessBaseAPI()
+        except RuntimeError as e:
+            logger.warning(f"Failed to initialize tesserocr, falling back to pytesseract: {e}")
+            return None
+
+    async def cleanup(self) -> None:
+        """Release the OCR engine and the matching thread pool."""
+        if self._tess is not None:
+            self._tess.End()
+            self._tess = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _on_frame(self, frame: NDArray[np.uint8]) -> None:
         """Handle new frame from screenshot stream."""
         self._frame = frame
-        self._cache.clear()  # Invalidate cache on new frame
+        # Matching runs on a grayscale pyramid, reuse the stream's one when available
+        bundle = self._stream.current_bundle
+        if bundle is not None and bundle.bgr is frame:
+            self._frame_pyramid = bundle.pyr_gray
+            self._frame_integrals = (bundle.integral, bundle.integral_sq)
+        else:
+            self._frame_pyramid = build_pyramid(_to_gray(frame))
+            self._frame_integrals = None
+        self._frame_gray = self._frame_pyramid[0]
+        self._frame_f32 = None
+        self._frame_umats = {}
+        # Cached results go stale by frame id, no need to touch the cache here
+        self._frame_id += 1
+
+    def _cache_get(self, key: _CacheKey) -> tuple[int, NDArray[np.uint8], TemplateMatch | None] | None:
+        """Get a cache entry if it belongs to the current frame."""
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != self._frame_id:
+            return None
+        return entry
+
+    def _cache_put(self, key: _CacheKey, template: NDArray[np.uint8], match: TemplateMatch | None) -> None:
+        """Store a match for the current frame, pruning old entries at most once per frame."""
+        if self._pruned_frame_id != self._frame_id:
+            self._cache = {k: entry for k, entry in self._cache.items() if entry[0] >= self._frame_id - 1}
+            self._pruned_frame_id = self._frame_id
+        self._cache[key] = (self._frame_id, template, match)
 
     async def find_template(
         self,
         template: NDArray[np.uint8],
+        *,
         search_frame: NDArray[np.uint8] | None = None,
+        region: tuple[int, int, int, int] | None = None,
         threshold: float = 0.9,
+        name: str | None = None,
     ) -> TemplateMatch | None:
-        """Find template in frame using simple template matching.
+        """Find template in frame using coarse-to-fine template matching.
+
+        Templates large enough are first matched on a downscaled copy of the
+        frame and then refined around the best candidate at each finer level.
+        Results against the current frame are cached until the next frame
+        arrives, so repeated lookups of the same template are free.
 
         Args:
-            template: numpy array of template image
+            template: numpy array of template image, BGR or grayscale
             search_frame: optional frame to search in, uses current frame if None
+            region: optional (x, y, w, h) area of the frame to search, whole frame if None
             threshold: minimum confidence threshold (0-1)
+            name: optional stable cache key for the template, defaults to its identity
 
         Returns:
-            TemplateMatch if found above threshold, else None
+            TemplateMatch if found above threshold, else None. The location is
+            always in full frame coordinates.
         """
-        frame = search_frame if search_frame is not None else self._frame
-        if frame is None:
+        if search_frame is not None:
+            gray_template = _to_gray(template)
+            frame_pyramid = build_pyramid(_to_gray(search_frame), _pyramid_levels(gray_template))
+            return self._match_template(frame_pyramid, gray_template, threshold, region)
+        if self._frame_pyramid is None:
             return None
 
-        # Simple template matching
-        result = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
-        result_array = np.asarray(result, dtype=np.float32)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result_array)
+        key = (name if name is not None else id(template), threshold, region)
+        entry = self._cache_get(key)
+        if entry is not None:
+            return entry[2]
+
+        match = self._match_template(self._frame_pyramid, _to_gray(template), threshold, region)
+        self._cache_put(key, template, match)
+        return match
+
+    def _match_template(
+        self,
+        frame_pyramid: list[NDArray[np.uint8]],
+        template: NDArray[np.uint8],
+        threshold: float,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> TemplateMatch | None:
+        """Run coarse-to-fine template matching and keep the best match above threshold."""
+        levels = min(len(frame_pyramid), _pyramid_levels(template))
+        template_pyramid = build_pyramid(template, levels)
+
+        # Full search at the coarsest level, restricted to the region
+        coarsest = levels - 1
+        x0, y0, x1, y1 = _level_bounds(region, coarsest, frame_pyramid[coarsest].shape)
+        match = self._search(frame_pyramid, coarsest, (x0, y0, x1, y1), template_pyramid[coarsest])
+        if match is None or match[0] < threshold - PYRAMID_MARGIN:
+            return None
+        confidence, (x, y) = match
+        x, y = x + x0, y + y0
+
+        # Refine around the candidate at each finer level
+        for level in range(coarsest - 1, -1, -1):
+            height, width = template_pyramid[level].shape[:2]
+            x0, y0, x1, y1 = _level_bounds(region, level, frame_pyramid[level].shape)
+            x0, y0 = max(x0, 2 * x - PYRAMID_PADDING), max(y0, 2 * y - PYRAMID_PADDING)
+            x1, y1 = min(x1, 2 * x + width + PYRAMID_PADDING), min(y1, 2 * y + height + PYRAMID_PADDING)
+            match = _best_match(frame_pyramid[level][y0:y1, x0:x1], template_pyramid[level])
+            if match is None:
+                return None
+            confidence, (x, y) = match
+            x, y = x + x0, y + y0
 
-        if max_val < threshold:
+        if confidence < threshold:
             return None
 
-        # Convert max_loc to tuple[int, int] to match type annotation
-        location = (int(max_loc[0]), int(max_loc[1]))
-        return TemplateMatch(location=location, confidence=float(max_val))
+        return TemplateMatch(location=(x, y), confidence=confidence)
+
+    def _search(
+        self,
+        frame_pyramid: list[NDArray[np.uint8]],
+        level: int,
+        bounds: tuple[int, int, int, int],
+        template: NDArray[np.uint8],
+    ) -> tuple[float, tuple[int, int]] | None:
+        """Search a template within bounds of a pyramid level.
+
+        Large searches of the current frame run through OpenCL when the device
+        supports it, uploading each pyramid level at most once per frame.
+
+        Args:
+            frame_pyramid: Grayscale frame pyramid to search
+            level: Pyramid level to search
+            bounds: (x0, y0, x1, y1) area of the level to search
+            template: Grayscale template at the level's scale
+
+        Returns:
+            Best (confidence, (x, y)) relative to the bounds, or None if the area is too small
+        """
+        x0, y0, x1, y1 = bounds
+        if not self._use_opencl or frame_pyramid is not self._frame_pyramid or (x1 - x0) * (y1 - y0) < OPENCL_MIN_AREA:
+            return _best_match(frame_pyramid[level][y0:y1, x0:x1], template)
+
+        if level not in self._frame_umats:
+            self._frame_umats[level] = to_umat(frame_pyramid[level])
+        image = cv2.UMat(self._frame_umats[level], (y0, y1), (x0, x1))
+        return _best_match_umat(image, (y1 - y0, x1 - x0), template)
+
+    async def find_templates(
+        self,
+        templates: dict[str, NDArray[np.uint8]],
+        region: tuple[int, int, int, int] | None = None,
+        threshold: float = 0.9,
+        definitive_threshold: float | None = None,
+    ) -> dict[str, TemplateMatch | None]:
+        """Find several templates in the current frame in one pass.
+
+        The frame's float conversion and integral images are computed once and
+        shared by all templates, and the window statistics are shared between
+        templates of the same size. Each template then only costs a single
+        correlation of its zero-mean version with the frame, and these run
+        concurrently on the service's thread pool in the given order.
+
+        Args:
+            templates: dict mapping template names to template images, BGR or grayscale
+            region: optional (x, y, w, h) area of the frame to search, whole frame if None
+            threshold: minimum confidence threshold (0-1)
+            definitive_threshold: optional confidence at which a match makes the
+                remaining templates irrelevant, matches not started yet are then skipped
+
+        Returns:
+            dict mapping each template name to its TemplateMatch, or None if not
+            found above threshold or skipped after a definitive match
+        """
+        if self._frame_gray is None:
+            return dict.fromkeys(templates)
+
+        results: dict[str, TemplateMatch | None] = {}
+        pending: dict[str, NDArray[np.uint8]] = {}
+        for name, template in templates.items():
+            entry = self._cache_get((name, threshold, region))
+            if entry is not None:
+                results[name] = entry[2]
+            else:
+                pending[name] = template
+        if not pending:
+            return results
+
+        frame_id = self._frame_id
+        frame, (integral, integral_sq) = self._frame_statistics()
+        x0, y0, x1, y1 = _level_bounds(region, 0, frame.shape)
+        search = frame[y0:y1, x0:x1]
+
+        # Window statistics are computed before yielding to the event loop, as the
+        # stream rewrites its integral images in place when the next frame arrives
+        gray_templates = {name: _to_gray(template) for name, template in pending.items()}
+        deviations: dict[tuple[int, int], NDArray[np.float32]] = {}
+        for gray_template in gray_templates.values():
+            size = (gray_template.shape[0], gray_template.shape[1])
+            counts = (search.shape[0] - size[0] + 1, search.shape[1] - size[1] + 1)
+            if size not in deviations and counts[0] > 0 and counts[1] > 0:
+                deviations[size] = _window_deviation(integral, integral_sq, (x0, y0), counts, size)
+
+        # The float frame is owned by this service, so correlations can safely run on the pool
+        matchable = {name: t for name, t in gray_templates.items() if (t.shape[0], t.shape[1]) in deviations}
+        loop = asyncio.get_running_loop()
+        futures = {
+            loop.run_in_executor(
+                self._executor, _match_ncc, search, (x0, y0), t, deviations[(t.shape[0], t.shape[1])], threshold
+            ): name
+            for name, t in matchable.items()
+        }
+        found = await _collect_matches(futures, definitive_threshold)
+
+        for name, template in pending.items():
+            results[name] = found.get(name)
+            # Skip caching skipped templates, and everything when a new frame arrived while matching
+            if frame_id == self._frame_id and (name in found or name not in matchable):
+                self._cache_put((name, threshold, region), template, results[name])
+
+        return results
+
+    def _frame_statistics(self) -> tuple[NDArray[np.float32], tuple[NDArray[np.int32], NDArray[np.float64]]]:
+        """Get the float grayscale frame and its integral images, computing them once per frame."""
+        gray = cast(NDArray[np.uint8], self._frame_gray)
+        if self._frame_integrals is None:
+            integral, integral_sq = cv2.integral2(gray, sdepth=cv2.CV_32S, sqdepth=cv2.CV_64F)
+            self._frame_integrals = (cast(NDArray[np.int32], integral), cast(NDArray[np.float64], integral_sq))
+        if self._frame_f32 is None:
+            self._frame_f32 = gray.astype(np.float32)
+        return self._frame_f32, self._frame_integrals
 
     async def get_text(
         self,
@@ -103,29 +564,15 @@ class VisionService:
 
         # Apply preprocessing if specified
         if preprocessing:
-            # Convert to grayscale while preserving uint8 dtype
-            gray_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-            roi = cast(NDArray[np.uint8], gray_roi)
-
-            # Apply binary threshold
-            if "threshold" in preprocessing:
-                _, thresholded = cv2.threshold(roi, int(preprocessing["threshold"]), 255, cv2.THRESH_BINARY)
-                roi = cast(NDArray[np.uint8], thresholded)
-
-            # Apply denoising
-            if preprocessing.get("denoise", False):
-                denoised = cv2.fastNlMeansDenoising(roi)
-                roi = cast(NDArray[np.uint8], denoised)
-
-            # Scale image
-            if "scale" in preprocessing:
-                scale = preprocessing["scale"]
-                scaled = cv2.resize(roi, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
-                roi = cast(NDArray[np.uint8], scaled)
+            # The current frame is already available in grayscale, so only other frames need converting
+            if source_frame is None and self._frame_gray is not None:
+                roi = self._frame_gray[y : y + h, x : x + w]
+            else:
+                roi = cast(NDArray[np.uint8], cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY, dst=self._ocr_buffer(0, roi.shape)))
+            roi = self._preprocess_text_roi(roi, preprocessing)
 
         try:
-            # Extract text using pytesseract
-            text: str = pytesseract.image_to_string(roi).strip()
+            text = self._recognize_text(roi)
             if not text:
                 return None
             else:
@@ -133,11 +580,96 @@ class VisionService:
         except Exception:
             return None
 
-    async def detect_game_state(self, state_templates: dict[str, NDArray[np.uint8]]) -> str | None:
+    def _recognize_text(self, image: NDArray[np.uint8]) -> str:
+        """Run OCR on an image with the best available tesseract backend.
+
+        Args:
+            image: Grayscale or 3-channel image to read
+
+        Returns:
+            Recognized text with surrounding whitespace removed
+        """
+        if self._tess is None:
+            # Extract text using pytesseract
+            text: str = pytesseract.image_to_string(image).strip()
+            return text
+
+        height, width = image.shape[:2]
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        self._tess.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+        return str(self._tess.GetUTF8Text()).strip()
+
+    def _ocr_buffer(self, index: int, shape: tuple[int, ...]) -> NDArray[np.uint8]:
+        """Get a scratch buffer for an OCR preprocessing stage.
+
+        Args:
+            index: Which of the two alternating scratch buffers to use
+            shape: Shape of the stage output, only height and width are used
+
+        Returns:
+            View into the scratch buffer, or a new array if the output does not fit
+        """
+        height, width = shape[:2]
+        buffer = self._ocr_buffers[index]
+        if height > buffer.shape[0] or width > buffer.shape[1]:
+            return np.empty((height, width), dtype=np.uint8)
+        return buffer[:height, :width]
+
+    def _preprocess_text_roi(self, roi: NDArray[np.uint8], preprocessing: dict[str, Any]) -> NDArray[np.uint8]:
+        """Apply threshold, denoise and scale steps to a grayscale region.
+
+        Stages write into alternating scratch buffers, so the input (which may be
+        a view of the shared frame) is never modified and no stage allocates.
+
+        Args:
+            roi: Grayscale region to preprocess
+            preprocessing: Preprocessing parameters as described in get_text
+
+        Returns:
+            Preprocessed region, valid until the next get_text call
+        """
+        # Start on the buffer not holding the input, in case it was converted into buffer 0
+        index = 1
+
+        # Apply binary threshold
+        if "threshold" in preprocessing:
+            dst = self._ocr_buffer(index, roi.shape)
+            cv2.threshold(roi, int(preprocessing["threshold"]), 255, cv2.THRESH_BINARY, dst=dst)
+            roi, index = dst, 1 - index
+
+        # Apply denoising
+        if preprocessing.get("denoise", False):
+            dst = self._ocr_buffer(index, roi.shape)
+            cv2.fastNlMeansDenoising(roi, dst=dst)
+            roi, index = dst, 1 - index
+
+        # Scale image
+        if "scale" in preprocessing:
+            scale = preprocessing["scale"]
+            size = (round(roi.shape[1] * scale), round(roi.shape[0] * scale))
+            dst = self._ocr_buffer(index, (size[1], size[0]))
+            cv2.resize(roi, size, dst=dst, interpolation=cv2.INTER_CUBIC)
+            roi = dst
+
+        return roi
+
+    async def detect_game_state(
+        self,
+        state_templates: dict[str, NDArray[np.uint8]],
+        search_regions: dict[str, tuple[int, int, int, int]] | None = None,
+        definitive_threshold: float = 0.98,
+    ) -> str | None:
         """Detect current game state using template matching.
 
+        States that won recently are tried first, and matching stops as soon
+        as one state scores above the definitive threshold.
+
         Args:
             state_templates: dict mapping state names to template images
+            search_regions: optional dict mapping state names to the (x, y, w, h)
+                area their template can appear in, states without one search the whole frame
+            definitive_threshold: confidence at which a state is accepted without
+                matching the remaining ones
 
         Returns:
             Name of detected state if confidence above threshold, else None
@@ -145,13 +677,44 @@ class VisionService:
         if self._frame is None:
             return None
 
+        ordered = sorted(state_templates, key=lambda name: self._state_prior.get(name, 0.0), reverse=True)
+        search_regions = search_regions or {}
+
+        # States limited to a region are cheap to match on their own, the rest share one batched pass
+        matches: dict[str, TemplateMatch | None] = {}
+        for state_name in ordered:
+            if state_name in search_regions:
+                match = await self.find_template(
+                    state_templates[state_name], name=state_name, region=search_regions[state_name]
+                )
+                matches[state_name] = match
+                if match and match.confidence >= definitive_threshold:
+                    break
+        else:
+            matches.update(
+                await self.find_templates(
+                    {name: state_templates[name] for name in ordered if name not in search_regions},
+                    definitive_threshold=definitive_threshold,
+                )
+            )
+
         best_confidence = 0.0
         best_state = None
-
-        for state_name, template in state_templates.items():
-            match = await self.find_template(template)
+        for state_name, match in matches.items():
             if match and match.confidence > best_confidence:
                 best_confidence = match.confidence
                 best_state = state_name
 
+        self._update_state_prior(best_state)
         return best_state
+
+    def _update_state_prior(self, state: str | None) -> None:
+        """Update the moving average of recently detected states.
+
+        Args:
+            state: State detected this time, or None if no state matched
+        """
+        for name in self._state_prior:
+            self._state_prior[name] *= 1 - STATE_PRIOR_ALPHA
+        if state is not None:
+            self._state_prior[state] = self._state_prior.get(state, 0.0) + STATE_PRIOR_ALPHA
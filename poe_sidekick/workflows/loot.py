@@ -1,6 +1,5 @@
 """Loot detection workflow implementation."""
 
-import asyncio
 import logging
 
 from ..core.workflow import BaseWorkflow
@@ -16,6 +15,8 @@ class LootWorkflow(BaseWorkflow):
     the loot module and logs detection events.
     """
 
+    __slots__ = ("loot_module",)
+
     def __init__(self, loot_module: LootModule):
         """Initialize the loot workflow.
 
@@ -30,10 +31,8 @@ class LootWorkflow(BaseWorkflow):
         logger.info("Starting loot detection workflow")
         await self.activate_modules()
         try:
-            # For now, just keep the module active
-            # We'll add more sophisticated logic later
-            while True:
-                await asyncio.sleep(1)
+            # The module does its work on incoming frames, idle until asked to stop
+            await self._stop_event.wait()
         finally:
             await self.deactivate_modules()
             logger.info("Loot detection workflow stopped")
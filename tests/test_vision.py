@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from poe_sidekick.services.vision import TemplateMatch, _collect_matches
+
+
+async def test_collect_matches_cancels_pending_when_a_match_raises() -> None:
+    loop = asyncio.get_running_loop()
+    failing: asyncio.Future[TemplateMatch | None] = loop.create_future()
+    queued: asyncio.Future[TemplateMatch | None] = loop.create_future()
+    failing.set_exception(RuntimeError("match failed"))
+
+    with pytest.raises(RuntimeError, match="match failed"):
+        await _collect_matches({failing: "broken", queued: "queued"}, definitive_threshold=None)
+
+    assert queued.cancelled()
+
+
+async def test_collect_matches_stops_at_definitive_match() -> None:
+    loop = asyncio.get_running_loop()
+    definitive: asyncio.Future[TemplateMatch | None] = loop.create_future()
+    queued: asyncio.Future[TemplateMatch | None] = loop.create_future()
+    definitive.set_result(TemplateMatch(location=(10, 20), confidence=0.95))
+
+    found = await _collect_matches({definitive: "hit", queued: "queued"}, definitive_threshold=0.9)
+
+    assert found == {"hit": definitive.result()}
+    assert queued.cancelled()